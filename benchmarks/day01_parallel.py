@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import argparse
+import functools
+import os
+import random
+import tempfile
+
+import support
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--size', type=support.parse_size, default='100M')
+    parser.add_argument('--max-jobs', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    part2 = support.import_day(1, 'part2')
+    parallel = support.import_day(1, 'parallel')
+
+    def single(filename: str) -> int:
+        with open(filename) as f:
+            return part2.compute_stream(support.iter_lines(f))
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filename = os.path.join(tmpdir, 'input.txt')
+        with open(filename, 'w') as f:
+            f.writelines(support.load_generate(1)(args.size, random.Random(0)))
+        print(f'{support.format_size(os.path.getsize(filename))}B of elves')
+
+        stats = support.measure(single, filename, repeat=args.repeat, warmup=0)
+        base = stats.median
+        print(f'{"compute_stream":>16}: {support.format_ns(base)}')
+
+        jobs = 1
+        while jobs <= args.max_jobs:
+            stats = support.measure(
+                functools.partial(parallel.compute_parallel, k=3, jobs=jobs),
+                filename,
+                repeat=args.repeat,
+                warmup=0,
+            )
+            print(
+                f'{f"parallel -j{jobs}":>16}: '
+                f'{support.format_ns(stats.median)} '
+                f'({base / stats.median:.2f}x)',
+            )
+            jobs *= 2
+
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
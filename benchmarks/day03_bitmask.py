@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import argparse
+import string
+from typing import Callable
+
+import support
+
+# bit `priority - 1`, so `mask.bit_length()` of a single item is its priority
+BIT = {c: 1 << i for i, c in enumerate(string.ascii_letters)}
+
+
+def _priority(c: str) -> int:
+    if c.islower():
+        return 1 + (ord(c) - ord('a'))
+    else:
+        return 27 + (ord(c) - ord('A'))
+
+
+def _mask(s: str) -> int:
+    return sum(map(BIT.__getitem__, set(s)))
+
+
+def part1_sets(lines: list[str]) -> int:
+    # day 3's original, an `&` of two sets per line
+    total = 0
+    for line in lines:
+        s, = set(line[:len(line) // 2]) & set(line[len(line) // 2:])
+        total += _priority(s)
+    return total
+
+
+def part1_bitmask(lines: list[str]) -> int:
+    total = 0
+    for line in lines:
+        half = len(line) // 2
+        total += (_mask(line[:half]) & _mask(line[half:])).bit_length()
+    return total
+
+
+def part2_sets(lines: list[str]) -> int:
+    total = 0
+    items = iter(lines)
+    for first, second, third in zip(items, items, items):
+        s, = set(first) & set(second) & set(third)
+        total += _priority(s)
+    return total
+
+
+def part2_bitmask(lines: list[str]) -> int:
+    total = 0
+    items = iter(lines)
+    for first, second, third in zip(items, items, items):
+        total += (_mask(first) & _mask(second) & _mask(third)).bit_length()
+    return total
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--size', type=support.parse_size, default='20M')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    s = support.generate_input(support.load_generate(3), args.size)
+    lines = s.splitlines()
+    print(f'{len(lines)} rucksacks ({support.format_size(len(s))}B)')
+
+    part1 = support.import_day(3, 'part1')
+    part2 = support.import_day(3, 'part2')
+    variants: dict[str, dict[str, Callable[[list[str]], int]]] = {
+        'part 1': {
+            'sets (original)': part1_sets,
+            'bitmask': part1_bitmask,
+            'set.intersection': part1.compute_stream,
+        },
+        'part 2': {
+            'sets (original)': part2_sets,
+            'bitmask': part2_bitmask,
+            'set.intersection': part2.compute_stream,
+        },
+    }
+    for name, funcs in variants.items():
+        print(name)
+        results = set()
+        for func_name, func in funcs.items():
+            stats = support.measure(func, lines, repeat=args.repeat, warmup=0)
+            results.add(func(lines))
+            print(f'{func_name:>20}: {support.format_ns(stats.median)}')
+        assert len(results) == 1, results
+
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import argparse
+import random
+
+import support
+
+
+def _generators(occupied: set[tuple[int, int]]) -> list[int]:
+    return [
+        sum(pt in occupied for pt in support.adjacent_8(x, y))
+        for x, y in occupied
+    ]
+
+
+def _occupancy(occupied: set[tuple[int, int]]) -> list[int]:
+    return support.occupancy_8(occupied, occupied)
+
+
+def _grid(occupied: set[tuple[int, int]]) -> bytearray:
+    return support.Grid2D.from_coords(occupied, margin=1).neighbor_masks_8()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--size', type=int, default=200)
+    parser.add_argument('--density', type=float, default=.4)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    rand = random.Random(0)
+    occupied = {
+        (x, y)
+        for x in range(args.size)
+        for y in range(args.size)
+        if rand.random() < args.density
+    }
+
+    print(f'{len(occupied)} points in a {args.size}x{args.size} grid')
+    for name, func in (
+            ('adjacent_8 generators', _generators),
+            ('occupancy_8', _occupancy),
+            ('Grid2D.neighbor_masks_8', _grid),
+    ):
+        stats = support.measure(func, occupied, repeat=args.repeat, warmup=1)
+        print(f'{name:>25}: {support.format_ns(stats.median)}')
+
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
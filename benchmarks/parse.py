@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import argparse
+from typing import Callable
+
+import support
+
+
+def _lines_int(s: str) -> list[int]:
+    return [int(line) for line in s.splitlines() if line]
+
+
+def _arrows(s: str) -> list[tuple[int, int]]:
+    return [
+        support.parse_point_comma(point)
+        for line in s.splitlines()
+        for point in line.split(' -> ')
+    ]
+
+
+def _csv_3d(s: str) -> list[tuple[int, ...]]:
+    return [tuple(map(int, line.split(','))) for line in s.splitlines()]
+
+
+def _array_unsigned(b: bytes) -> object:
+    return support.parse_ints_array(b, signed=False)
+
+
+# the original list-building parsers take str, the bulk ones take bytes
+STR_VARIANTS: dict[int, dict[str, Callable[[str], object]]] = {
+    1: {'int per line': _lines_int},
+    14: {'parse_point_comma': _arrows},
+    18: {'split(",")': _csv_3d},
+    20: {'parse_numbers_split': support.parse_numbers_split},
+}
+BYTES_VARIANTS: dict[int, dict[str, Callable[[bytes], object]]] = {
+    1: {'parse_numbers_array': support.parse_numbers_array},
+    14: {
+        'parse_ints_array': support.parse_ints_array,
+        'parse_ints_array unsigned': _array_unsigned,
+    },
+    18: {
+        'parse_ints_array': support.parse_ints_array,
+        'parse_ints_array unsigned': _array_unsigned,
+    },
+    20: {
+        'parse_numbers_array': support.parse_numbers_array,
+        'parse_ints_array': support.parse_ints_array,
+    },
+}
+
+
+def _report(name: str, stats: support.Stats, size: int) -> None:
+    mb_s = size / stats.median * 1e9 / 1e6
+    t = support.format_ns(stats.median)
+    print(f'{name:>26}: {t:>8} ({mb_s:.1f} MB/s)')
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--size', type=support.parse_size, default='1M')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    for day in STR_VARIANTS:
+        s = support.generate_input(support.load_generate(day), args.size)
+        b = s.encode()
+        print(f'day {day} ({support.format_size(len(b))}B)')
+        for name, str_func in STR_VARIANTS[day].items():
+            stats = support.measure(str_func, s, repeat=args.repeat, warmup=1)
+            _report(name, stats, len(b))
+        for name, bytes_func in BYTES_VARIANTS[day].items():
+            stats = support.measure(
+                bytes_func, b, repeat=args.repeat, warmup=1,
+            )
+            _report(name, stats, len(b))
+
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,285 @@
+from __future__ import annotations
+
+import argparse
+import collections
+import heapq
+import itertools
+from typing import Any
+from typing import Callable
+
+import support
+
+Graph = list[list[int]]
+
+
+def _input(day: int, size: int | None) -> str:
+    if size is None:
+        return support.read_input(day)
+    else:
+        return support.generate_input(support.load_generate(day), size)
+
+
+def _heap_paths(graph: Graph, goal: int) -> dict[int, int]:
+    # day 12's original search
+    q = [(0, goal)]
+    path_lengths = {goal: 0}
+    while q:
+        cost, current = heapq.heappop(q)
+        for point in graph[current]:
+            if point not in path_lengths or cost + 1 < path_lengths[point]:
+                path_lengths[point] = cost + 1
+                heapq.heappush(q, (cost + 1, point))
+    return path_lengths
+
+
+def _deque_blueprint(blueprint: Any, time_minutes: int) -> int:
+    # day 19's original search
+    max_ore = max(
+        blueprint.ore_bot_ore,
+        blueprint.cla_bot_ore,
+        blueprint.obs_bot_ore,
+        blueprint.geo_bot_ore,
+    )
+
+    seen = set()
+    hits = 0
+    best_at: dict[int, int] = {}
+    todo = collections.deque([(0, 1, 0, 0, 0, 0, 0, 0, 0)])
+    while todo:
+        m, ore_b, cla_b, obs_b, geo_b, ore, cla, obs, geo = todo.popleft()
+
+        ore = min(max_ore * (time_minutes - m), ore)
+        cla = min(blueprint.obs_bot_cla * (time_minutes - m), cla)
+        obs = min(blueprint.geo_bot_obs * (time_minutes - m), obs)
+        ore_b = min(ore_b, max_ore)
+        cla_b = min(cla_b, blueprint.obs_bot_cla)
+        obs_b = min(obs_b, blueprint.geo_bot_obs)
+
+        tup = (m, ore_b, cla_b, obs_b, geo_b, ore, cla, obs, geo)
+        if tup in seen:
+            hits += 1
+            continue
+        else:
+            seen.add(tup)
+
+        best_at[m] = max(best_at.get(m, 0), geo)
+
+        if m == time_minutes:
+            continue
+
+        # always buy geode if possible
+        if ore >= blueprint.geo_bot_ore and obs >= blueprint.geo_bot_obs:
+            todo.append((
+                m + 1,
+                ore_b,
+                cla_b,
+                obs_b,
+                geo_b + 1,
+                ore + ore_b - blueprint.geo_bot_ore,
+                cla + cla_b,
+                obs + obs_b - blueprint.geo_bot_obs,
+                geo + geo_b,
+            ))
+            continue
+
+        # can buy obsidian?
+        if ore >= blueprint.obs_bot_ore and cla >= blueprint.obs_bot_cla:
+            todo.append((
+                m + 1,
+                ore_b,
+                cla_b,
+                obs_b + 1,
+                geo_b,
+                ore + ore_b - blueprint.obs_bot_ore,
+                cla + cla_b - blueprint.obs_bot_cla,
+                obs + obs_b,
+                geo + geo_b,
+            ))
+
+        # can buy clay?
+        if ore >= blueprint.cla_bot_ore:
+            todo.append((
+                m + 1,
+                ore_b,
+                cla_b + 1,
+                obs_b,
+                geo_b,
+                ore + ore_b - blueprint.cla_bot_ore,
+                cla + cla_b,
+                obs + obs_b,
+                geo + geo_b,
+            ))
+
+        # can buy ore?
+        if ore >= blueprint.ore_bot_ore:
+            todo.append((
+                m + 1,
+                ore_b + 1,
+                cla_b,
+                obs_b,
+                geo_b,
+                ore + ore_b - blueprint.ore_bot_ore,
+                cla + cla_b,
+                obs + obs_b,
+                geo + geo_b,
+            ))
+
+        # buy nothing
+        todo.append((
+            m + 1,
+            ore_b,
+            cla_b,
+            obs_b,
+            geo_b,
+            ore + ore_b,
+            cla + cla_b,
+            obs + obs_b,
+            geo + geo_b,
+        ))
+
+    support.count('new states', len(seen))
+    support.count('seen hits', hits)
+    return best_at[time_minutes]
+
+
+def day12(s: str) -> dict[str, Callable[[], object]]:
+    grid, graph, start, goal = support.import_day(12, 'part1').parse_input(s)
+    # `graph` points backwards, from a cell to the cells that can reach it
+    forward: Graph = [[] for _ in graph]
+    for i, sources in enumerate(graph):
+        for j in sources:
+            forward[j].append(i)
+
+    def weighted(i: int) -> list[tuple[int, int]]:
+        return [(j, 1) for j in graph[i]]
+
+    def to_start(i: int) -> int:
+        x, y = grid.coords(i)
+        start_x, start_y = grid.coords(start)
+        return abs(x - start_x) + abs(y - start_y)
+
+    return {
+        'heapq (original)': lambda: _heap_paths(graph, goal)[start],
+        'bfs': lambda: support.bfs((goal,), graph.__getitem__)[start],
+        'bfs_int': lambda: support.bfs_int(graph, (goal,))[start],
+        'bfs_01': lambda: support.bfs_01(weighted, (goal,))[start],
+        'dijkstra': lambda: support.dijkstra(
+            weighted, (goal,), goal=start,
+        )[start],
+        'astar': lambda: support.astar(weighted, goal, start, to_start),
+        'bfs_bidirectional': lambda: support.bfs_bidirectional(
+            graph.__getitem__, goal, start,
+            reverse_neighbors=forward.__getitem__,
+        ),
+    }
+
+
+def day16(s: str) -> dict[str, Callable[[], object]]:
+    edges, rates = support.import_day(16, 'part1').parse_input(s)
+    # the original takes ~25s for all valves of a real input, so only time
+    # the distances between a few of them
+    meaningful = ['AA', *(k for k, v in rates.items() if v)][:6]
+
+    def path_tuples() -> list[tuple[tuple[str, str], int]]:
+        # day 16's original search, queueing whole paths
+        weights = {}
+        for a, b in itertools.combinations(meaningful, r=2):
+            todo: collections.deque[tuple[str, ...]]
+            todo = collections.deque([(a,)])
+            path: tuple[str, ...] = ()
+            while todo:
+                path = todo.popleft()
+                if path[-1] == b:
+                    break
+                else:
+                    todo.extend((*path, n) for n in edges[path[-1]])
+            weights[(a, b)] = weights[(b, a)] = len(path)
+        return sorted(weights.items())
+
+    def per_valve() -> list[tuple[tuple[str, str], int]]:
+        weights = {}
+        for a in meaningful:
+            steps = support.bfs((a,), edges.__getitem__)
+            for b in meaningful:
+                if a != b:
+                    weights[(a, b)] = steps[b] + 1
+        return sorted(weights.items())
+
+    return {'path tuples (original)': path_tuples, 'bfs': per_valve}
+
+
+def day18(s: str) -> dict[str, Callable[[], object]]:
+    adjacent_faces = support.import_day(18, 'part1').adjacent_faces
+    cubes = {
+        (int(x), int(y), int(z))
+        for x, y, z in (line.split(',') for line in s.splitlines())
+    }
+    (min_x, max_x), (min_y, max_y), (min_z, max_z) = support.bounds(cubes)
+    air = {
+        (x, y, z)
+        for x in range(min_x - 1, max_x + 2)
+        for y in range(min_y - 1, max_y + 2)
+        for z in range(min_z - 1, max_z + 2)
+    } - cubes
+
+    def stack() -> int:
+        # day 18's flood fill: discarding from `remaining` marks visits
+        remaining = set(air)
+        todo = [min(remaining)]
+        while todo:
+            pt = todo.pop()
+            if pt in remaining:
+                remaining.discard(pt)
+            else:
+                continue
+            todo.extend(adjacent_faces(*pt))
+        return len(air) - len(remaining)
+
+    def bfs() -> int:
+        return len(
+            support.bfs(
+                (min(air),),
+                lambda pt: [n for n in adjacent_faces(*pt) if n in air],
+            ),
+        )
+
+    return {'stack (original)': stack, 'bfs': bfs}
+
+
+def day19(s: str) -> dict[str, Callable[[], object]]:
+    part1 = support.import_day(19, 'part1')
+    # a whole blueprint takes seconds, so only search its first minutes
+    blueprint = part1.parse_blueprints(s)[0]
+    return {
+        'deque (original)': lambda: _deque_blueprint(blueprint, 22),
+        'bfs': lambda: part1.compute_blueprint(blueprint, 22),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        '--size', type=support.parse_size,
+        help='use a generated input of this size instead of input.txt',
+    )
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    for day, variants in (
+            (12, day12), (16, day16), (18, day18), (19, day19),
+    ):
+        print(f'day {day}')
+        results = set()
+        for name, func in variants(_input(day, args.size)).items():
+            stats = support.measure(
+                lambda f: f(), func, repeat=args.repeat, warmup=1,
+            )
+            results.add(repr(func()))
+            print(f'{name:>25}: {support.format_ns(stats.median)}')
+        assert len(results) == 1, results
+
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
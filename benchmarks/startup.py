@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import argparse
+import re
+import subprocess
+import sys
+
+import support
+
+IMPORTTIME_RE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)$')
+
+
+def import_times(module: str) -> dict[str, int]:
+    """cumulative microseconds of `module` and of each module it imports"""
+    out = subprocess.run(
+        (sys.executable, '-X', 'importtime', '-c', f'import {module}'),
+        cwd=support.ROOT, capture_output=True, text=True, check=True,
+    ).stderr
+
+    ret = {}
+    for line in out.splitlines():
+        match = IMPORTTIME_RE.match(line)
+        if match and len(match[3]) <= 2:
+            ret[match[4]] = int(match[2])
+    return ret
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('days', type=int, nargs='*')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    for day, part in support.get_solvers(args.days):
+        module = f'day{day:02}.part{part}'
+        best = min(
+            (import_times(module) for _ in range(args.repeat)),
+            key=lambda times: times.get(module, 0),
+        )
+        total = best.pop(module)
+        top = sorted(best.items(), key=lambda kv: kv[1], reverse=True)[:3]
+        details = ', '.join(f'{name} {us / 1000:.1f}ms' for name, us in top)
+        print(f'{module:>12}: {support.format_ns(total * 1000)} ({details})')
+
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -3,8 +3,6 @@ from __future__ import annotations
 import argparse
 import os.path
 
-import pytest
-
 import support
 
 INPUT_TXT = os.path.join(os.path.dirname(__file__), 'input.txt')
@@ -28,7 +26,7 @@ INPUT_S = '''\
 EXPECTED = 1
 
 
-@pytest.mark.parametrize(
+@support.parametrize(
     ('input_s', 'expected'),
     (
         (INPUT_S, EXPECTED),
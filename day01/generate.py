@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import random
+from typing import Generator
+
+import support
+
+
+def generate(size: int, rand: random.Random) -> Generator[str, None, None]:
+    n = 0
+    while n < size:
+        elf = ''.join(
+            f'{rand.randint(1000, 60000)}\n'
+            for _ in range(rand.randint(1, 15))
+        )
+        chunk = f'\n{elf}' if n else elf
+        yield chunk
+        n += len(chunk)
+
+
+def test() -> None:
+    from day01 import part1
+    from day01 import part2
+
+    s = support.generate_input(generate, 1024)
+    assert len(s) >= 1024
+    for elf in s.split('\n\n'):
+        calories = [int(line) for line in elf.splitlines()]
+        assert 1 <= len(calories) <= 15
+        assert all(1000 <= n <= 60000 for n in calories)
+    assert part1.compute(s) == 552524
+    assert part2.compute(s) == 1559744
+
+
+if __name__ == '__main__':
+    raise SystemExit(support.generator_main(generate))
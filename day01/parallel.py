@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import argparse
+import concurrent.futures
+import heapq
+import itertools
+import mmap
+import os.path
+import pathlib
+
+import support
+
+INPUT_TXT = os.path.join(os.path.dirname(__file__), 'input.txt')
+
+
+def chunk_bounds(data: bytes | mmap.mmap, n: int) -> list[tuple[int, int]]:
+    """(start, end) of about `n` chunks, each ending on an elf boundary"""
+    bounds = []
+    start = 0
+    for i in range(1, n):
+        pos = data.find(b'\n\n', max(start, len(data) * i // n))
+        if pos == -1:
+            break
+        bounds.append((start, pos + 1))
+        start = pos + 2
+    bounds.append((start, len(data)))
+    return bounds
+
+
+def top_k(chunk: bytes, k: int) -> list[int]:
+    """the `k` largest elf totals of a chunk of whole elves"""
+    totals = (sum(map(int, elf.split())) for elf in chunk.split(b'\n\n'))
+    return heapq.nlargest(k, totals)
+
+
+def _top_k_file(filename: str, start: int, end: int, k: int) -> list[int]:
+    with support.mmap_input(filename) as m:
+        return top_k(m[start:end], k)
+
+
+def compute_parallel(filename: str, k: int, jobs: int | None = None) -> int:
+    jobs = jobs or os.cpu_count() or 1
+    with support.mmap_input(filename) as m:
+        bounds = chunk_bounds(m, jobs)
+
+    with concurrent.futures.ProcessPoolExecutor(jobs) as executor:
+        futures = [
+            executor.submit(_top_k_file, filename, start, end, k)
+            for start, end in bounds
+        ]
+        results = [future.result() for future in futures]
+    return sum(heapq.nlargest(k, itertools.chain.from_iterable(results)))
+
+
+INPUT_S = '''\
+1000
+2000
+3000
+
+4000
+
+5000
+6000
+
+7000
+8000
+9000
+
+10000
+'''
+
+
+@support.parametrize('n', (1, 2, 3, 5, 10))
+def test_chunk_bounds(n: int) -> None:
+    data = INPUT_S.encode()
+    chunks = [data[start:end] for start, end in chunk_bounds(data, n)]
+    assert b'\n'.join(chunks) == data
+    elves = sorted(itertools.chain.from_iterable(
+        [elf.split() for elf in chunk.split(b'\n\n')] for chunk in chunks
+    ))
+    assert elves == sorted(elf.split() for elf in data.split(b'\n\n'))
+
+
+@support.parametrize(
+    ('k', 'expected'),
+    (
+        (1, [24000]),
+        (3, [24000, 11000, 10000]),
+    ),
+)
+def test_top_k(k: int, expected: list[int]) -> None:
+    assert top_k(INPUT_S.encode(), k) == expected
+
+
+def test_compute_parallel(tmp_path: pathlib.Path) -> None:
+    from day01 import part2
+
+    s = support.generate_input(support.load_generate(1), 4096)
+    filename = tmp_path.joinpath('input.txt')
+    filename.write_text(s)
+
+    for k in (1, 3):
+        expected = part2.compute_stream(s.splitlines(), k=k)
+        assert compute_parallel(str(filename), k, jobs=3) == expected
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('data_file', nargs='?', default=INPUT_TXT)
+    parser.add_argument('--part', type=int, choices=(1, 2), default=2)
+    parser.add_argument('--jobs', '-j', type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    k = 1 if args.part == 1 else 3
+    with support.timing():
+        print(compute_parallel(args.data_file, k, args.jobs))
+
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
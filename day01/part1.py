@@ -2,16 +2,14 @@ from __future__ import annotations
 
 import argparse
 import os.path
-
-import pytest
+from typing import Iterable
 
 import support
 
 INPUT_TXT = os.path.join(os.path.dirname(__file__), 'input.txt')
 
 
-def compute(s: str) -> int:
-    lines = s.splitlines()
+def compute_stream(lines: Iterable[str]) -> int:
     max_calories = 0
     current_elf_calories = 0
     for line in lines:
@@ -25,6 +23,10 @@ def compute(s: str) -> int:
     return max_calories
 
 
+def compute(s: str) -> int:
+    return compute_stream(s.splitlines())
+
+
 INPUT_S = '''\
 1000
 2000
@@ -44,7 +46,7 @@ INPUT_S = '''\
 EXPECTED = 24000
 
 
-@pytest.mark.parametrize(
+@support.parametrize(
     ('input_s', 'expected'),
     (
             (INPUT_S, EXPECTED),
@@ -60,7 +62,7 @@ def main() -> int:
     args = parser.parse_args()
 
     with open(args.data_file) as f, support.timing():
-        print(compute(f.read()))
+        print(compute_stream(support.iter_lines(f)))
 
     return 0
 
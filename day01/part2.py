@@ -1,29 +1,23 @@
 from __future__ import annotations
 
 import argparse
+import heapq
 import os.path
-
-import pytest
+from typing import Iterable
 
 import support
 
 INPUT_TXT = os.path.join(os.path.dirname(__file__), 'input.txt')
 
 
-def compute(s: str) -> int:
-    lines = s.splitlines()
-    current_elf_calories = 0
-    all_elfs_calories = []
-    for line in lines:
-        if not line:
-            all_elfs_calories.append(current_elf_calories)
-            current_elf_calories = 0
-        else:
-            current_elf_calories += int(line)
-    if current_elf_calories:
-        all_elfs_calories.append(current_elf_calories)
+def compute_stream(lines: Iterable[str], k: int = 3) -> int:
+    totals = (sum(map(int, record)) for record in support.iter_records(lines))
+    # a heap of at most k totals: O(n log k) time and O(k) memory
+    return sum(heapq.nlargest(k, totals))
 
-    return sum(list(sorted(all_elfs_calories, reverse=True))[:3])
+
+def compute(s: str) -> int:
+    return compute_stream(s.splitlines())
 
 
 INPUT_S = '''\
@@ -45,7 +39,7 @@ INPUT_S = '''\
 EXPECTED = 45000
 
 
-@pytest.mark.parametrize(
+@support.parametrize(
     ('input_s', 'expected'),
     (
             (INPUT_S, EXPECTED),
@@ -55,13 +49,26 @@ def test(input_s: str, expected: int) -> None:
     assert compute(input_s) == expected
 
 
+@support.parametrize(
+    ('k', 'expected'),
+    (
+        (1, 24000),
+        (3, 45000),
+        (10, 55000),
+    ),
+)
+def test_top_k(k: int, expected: int) -> None:
+    assert compute_stream(INPUT_S.splitlines(), k=k) == expected
+
+
 def main() -> int:
     parser = argparse.ArgumentParser()
     parser.add_argument('data_file', nargs='?', default=INPUT_TXT)
+    parser.add_argument('-k', type=int, default=3, help='sum the top k elves')
     args = parser.parse_args()
 
     with open(args.data_file) as f, support.timing():
-        print(compute(f.read()))
+        print(compute_stream(support.iter_lines(f), k=args.k))
 
     return 0
 
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import random
+from typing import Generator
+
+import support
+
+
+def generate(size: int, rand: random.Random) -> Generator[str, None, None]:
+    for _ in range(0, size, 4):
+        yield f'{rand.choice("ABC")} {rand.choice("XYZ")}\n'
+
+
+def test() -> None:
+    from day02 import part1
+    from day02 import part2
+
+    s = support.generate_input(generate, 1024)
+    lines = s.splitlines()
+    assert len(lines) == 1024 // 4
+    assert {line[0] for line in lines} <= set('ABC')
+    assert {line[1:] for line in lines} <= {' X', ' Y', ' Z'}
+    assert part1.compute(s) == 1310
+    assert part2.compute(s) == 1338
+
+
+if __name__ == '__main__':
+    raise SystemExit(support.generator_main(generate))
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import argparse
+import collections
+import itertools
 import os.path
-
-import pytest
+from typing import Iterable
 
 import support
 
@@ -11,24 +12,37 @@ INPUT_TXT = os.path.join(os.path.dirname(__file__), 'input.txt')
 
 shape = {'R': 1, 'P': 2, 'S': 3}
 win = {'R': 'S', 'P': 'R', 'S': 'P'}
-trans = {
+trans = str.maketrans({
     'A': 'R', 'B': 'P', 'C': 'S',
     'X': 'R', 'Y': 'P', 'Z': 'S',
+})
+
+
+def _score(line: str) -> int:
+    a, b = line.translate(trans).split()
+    n = shape[b]
+    if a == b:
+        n += 3
+    elif win[a] != b:
+        n += 6
+    return n
+
+
+# there are only 9 possible rounds: score each once, then count them
+SCORES = {
+    line: _score(line)
+    for line in map(' '.join, itertools.product('ABC', 'XYZ'))
 }
 
 
+def compute_stream(lines: Iterable[str]) -> int:
+    counts = collections.Counter(lines)
+    return sum(SCORES[line] * n for line, n in counts.items())
+
+
 def compute(s: str) -> int:
-    for k, v in trans.items():
-        s = s.replace(k, v)
-
-    n = 0
-    for a, b in [line.split() for line in s.splitlines()]:
-        if a == b:
-            n += 3
-        elif win[a] != b:
-            n += 6
-        n += shape[b]
-    return n
+    # rounds can't match across lines, so each count is one C-level scan
+    return sum(score * s.count(line) for line, score in SCORES.items())
 
 
 INPUT_S = '''\
@@ -39,7 +53,7 @@ C Z
 EXPECTED = 15
 
 
-@pytest.mark.parametrize(
+@support.parametrize(
     ('input_s', 'expected'),
     (
         (INPUT_S, EXPECTED),
@@ -47,6 +61,7 @@ EXPECTED = 15
 )
 def test(input_s: str, expected: int) -> None:
     assert compute(input_s) == expected
+    assert compute_stream(input_s.splitlines()) == expected
 
 
 def main() -> int:
@@ -55,7 +70,7 @@ def main() -> int:
     args = parser.parse_args()
 
     with open(args.data_file) as f, support.timing():
-        print(compute(f.read()))
+        print(compute_stream(support.iter_lines(f)))
 
     return 0
 
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import argparse
+import collections
+import itertools
 import os.path
-
-import pytest
+from typing import Iterable
 
 import support
 
@@ -12,23 +13,34 @@ INPUT_TXT = os.path.join(os.path.dirname(__file__), 'input.txt')
 shape = {'R': 1, 'P': 2, 'S': 3}
 win = {'R': 'S', 'P': 'R', 'S': 'P'}
 lose = {v: k for k, v in win.items()}
-trans = {'A': 'R', 'B': 'P', 'C': 'S'}
+trans = str.maketrans({'A': 'R', 'B': 'P', 'C': 'S'})
 
 
-def compute(s: str) -> int:
-    for k, v in trans.items():
-        s = s.replace(k, v)
+def _score(line: str) -> int:
+    a, b = line.translate(trans).split()
+    if b == 'X':  # lose
+        return shape[win[a]]
+    elif b == 'Y':
+        return shape[a] + 3
+    else:
+        return shape[lose[a]] + 6
+
+
+# there are only 9 possible rounds: score each once, then count them
+SCORES = {
+    line: _score(line)
+    for line in map(' '.join, itertools.product('ABC', 'XYZ'))
+}
 
-    n = 0
-    for a, b in [line.split() for line in s.splitlines()]:
-        if b == 'X':  # lose
-            n += shape[win[a]]
-        elif b == 'Y':
-            n += shape[a] + 3
-        else:
-            n += shape[lose[a]] + 6
 
-    return n
+def compute_stream(lines: Iterable[str]) -> int:
+    counts = collections.Counter(lines)
+    return sum(SCORES[line] * n for line, n in counts.items())
+
+
+def compute(s: str) -> int:
+    # rounds can't match across lines, so each count is one C-level scan
+    return sum(score * s.count(line) for line, score in SCORES.items())
 
 
 INPUT_S = '''\
@@ -39,7 +51,7 @@ C Z
 EXPECTED = 12
 
 
-@pytest.mark.parametrize(
+@support.parametrize(
     ('input_s', 'expected'),
     (
         (INPUT_S, EXPECTED),
@@ -47,6 +59,7 @@ EXPECTED = 12
 )
 def test(input_s: str, expected: int) -> None:
     assert compute(input_s) == expected
+    assert compute_stream(input_s.splitlines()) == expected
 
 
 def main() -> int:
@@ -55,7 +68,7 @@ def main() -> int:
     args = parser.parse_args()
 
     with open(args.data_file) as f, support.timing():
-        print(compute(f.read()))
+        print(compute_stream(support.iter_lines(f)))
 
     return 0
 
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import random
+import string
+from typing import Generator
+
+import support
+
+
+def _rucksack(rand: random.Random, own: list[str], badge: str) -> str:
+    # the items in the two halves only overlap in `shared`
+    shared, *rest = own
+    left_pool = [shared, badge, *rest[:len(rest) // 2]]
+    right_pool = [shared, *rest[len(rest) // 2:]]
+    half = rand.randint(len(left_pool), 16)
+    left = [shared, badge, *rand.choices(left_pool, k=half - 2)]
+    right = [shared, *rand.choices(right_pool, k=half - 1)]
+    rand.shuffle(left)
+    rand.shuffle(right)
+    return ''.join(left + right)
+
+
+def generate(size: int, rand: random.Random) -> Generator[str, None, None]:
+    n = 0
+    while n < size:
+        # each elf of a group gets its own letters so only the badge is common
+        letters = list(string.ascii_letters)
+        rand.shuffle(letters)
+        badge = letters.pop()
+        for i in range(3):
+            own = letters[i * 17:(i + 1) * 17]
+            line = f'{_rucksack(rand, own, badge)}\n'
+            yield line
+            n += len(line)
+
+
+def test() -> None:
+    from day03 import part1
+    from day03 import part2
+
+    s = support.generate_input(generate, 1024)
+    lines = s.splitlines()
+    assert len(lines) % 3 == 0
+    for line in lines:
+        half = len(line) // 2
+        assert len(line) == half * 2
+        assert len(set(line[:half]) & set(line[half:])) == 1
+    for i in range(0, len(lines), 3):
+        assert len(set(lines[i]).intersection(*lines[i + 1:i + 3])) == 1
+    assert part1.compute(s) == 1076
+    assert part2.compute(s) == 330
+
+
+if __name__ == '__main__':
+    raise SystemExit(support.generator_main(generate))
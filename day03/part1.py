@@ -2,29 +2,28 @@ from __future__ import annotations
 
 import argparse
 import os.path
-
-import pytest
+import string
+from typing import Iterable
 
 import support
 
 INPUT_TXT = os.path.join(os.path.dirname(__file__), 'input.txt')
 
+PRIORITY = {c: i for i, c in enumerate(string.ascii_letters, start=1)}
 
-def compute(s: str) -> int:
+
+def compute_stream(lines: Iterable[str]) -> int:
     priorities_sum = 0
-    lines = s.splitlines()
     for line in lines:
-        part1 = line[:len(line) // 2]
-        part2 = line[len(line) // 2:]
+        half = len(line) // 2
+        s, = set(line[:half]).intersection(line[half:])
+        priorities_sum += PRIORITY[s]
 
-        s, = set(part1) & set(part2)
+    return priorities_sum
 
-        if s.islower():
-            priorities_sum += 1 + (ord(s) - ord('a'))
-        else:
-            priorities_sum += 27 + (ord(s) - ord('A'))
 
-    return priorities_sum
+def compute(s: str) -> int:
+    return compute_stream(s.splitlines())
 
 
 INPUT_S = '''\
@@ -38,7 +37,7 @@ CrZsJsPPZsGzwwsLwLmpwMDw
 EXPECTED = 157
 
 
-@pytest.mark.parametrize(
+@support.parametrize(
     ('input_s', 'expected'),
     (
         (INPUT_S, EXPECTED),
@@ -54,7 +53,7 @@ def main() -> int:
     args = parser.parse_args()
 
     with open(args.data_file) as f, support.timing():
-        print(compute(f.read()))
+        print(compute_stream(support.iter_lines(f)))
 
     return 0
 
@@ -2,32 +2,30 @@ from __future__ import annotations
 
 import argparse
 import os.path
-
-import pytest
+import string
+from typing import Iterable
 
 import support
 
 INPUT_TXT = os.path.join(os.path.dirname(__file__), 'input.txt')
 
+PRIORITY = {c: i for i, c in enumerate(string.ascii_letters, start=1)}
 
-def compute(s: str) -> int:
+
+def compute_stream(lines: Iterable[str]) -> int:
     priorities_sum = 0
-    items = iter(s.splitlines())
-
-    while True:
-        try:
-            s, = set(next(items)) & set(next(items)) & set(next(items))
-        except StopIteration:
-            break
-        else:
-            if s.islower():
-                priorities_sum += 1 + (ord(s) - ord('a'))
-            else:
-                priorities_sum += 27 + (ord(s) - ord('A'))
+    items = iter(lines)
+    for first, second, third in zip(items, items, items):
+        s, = set(first).intersection(second, third)
+        priorities_sum += PRIORITY[s]
 
     return priorities_sum
 
 
+def compute(s: str) -> int:
+    return compute_stream(s.splitlines())
+
+
 INPUT_S = '''\
 vJrwpWtwJgWrhcsFMMfFFhFp
 jqHRNqRjqzjGDLGLrsFMfFZSrLrFZsSL
@@ -39,7 +37,7 @@ CrZsJsPPZsGzwwsLwLmpwMDw
 EXPECTED = 70
 
 
-@pytest.mark.parametrize(
+@support.parametrize(
     ('input_s', 'expected'),
     (
         (INPUT_S, EXPECTED),
@@ -55,7 +53,7 @@ def main() -> int:
     args = parser.parse_args()
 
     with open(args.data_file) as f, support.timing():
-        print(compute(f.read()))
+        print(compute_stream(support.iter_lines(f)))
 
     return 0
 
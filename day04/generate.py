@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import random
+from typing import Generator
+
+import support
+
+
+def _range(rand: random.Random) -> str:
+    start = rand.randint(1, 99)
+    return f'{start}-{rand.randint(start, 99)}'
+
+
+def generate(size: int, rand: random.Random) -> Generator[str, None, None]:
+    n = 0
+    while n < size:
+        line = f'{_range(rand)},{_range(rand)}\n'
+        yield line
+        n += len(line)
+
+
+def test() -> None:
+    from day04 import part1
+    from day04 import part2
+
+    s = support.generate_input(generate, 1024)
+    for line in s.splitlines():
+        a, b, c, d = (int(n) for n in line.replace(',', '-').split('-'))
+        assert 1 <= a <= b <= 99
+        assert 1 <= c <= d <= 99
+    assert part1.compute(s) == 28
+    assert part2.compute(s) == 53
+
+
+if __name__ == '__main__':
+    raise SystemExit(support.generator_main(generate))
@@ -1,18 +1,18 @@
 from __future__ import annotations
 
 import argparse
+import operator
 import os.path
-
-import pytest
+from typing import Iterable
 
 import support
 
 INPUT_TXT = os.path.join(os.path.dirname(__file__), 'input.txt')
 
 
-def compute(s: str) -> int:
+def compute_stream(lines: Iterable[str]) -> int:
     n = 0
-    for line in s.splitlines():
+    for line in lines:
         ab, cd = line.split(',')
         a_s, b_s = ab.split('-')
         c_s, d_s = cd.split('-')
@@ -27,6 +27,15 @@ def compute(s: str) -> int:
     return n
 
 
+def compute(s: str) -> int:
+    records = support.parse_int_records(s.encode(), 4, signed=False)
+    a, b, c, d = (records.column(i) for i in range(4))
+    # one range contains the other when its ends move in opposite directions
+    starts = map(operator.sub, c, a)
+    ends = map(operator.sub, d, b)
+    return sum(map((0).__ge__, map(operator.mul, starts, ends)))
+
+
 INPUT_S = '''\
 2-4,6-8
 2-3,4-5
@@ -38,7 +47,7 @@ INPUT_S = '''\
 EXPECTED = 2
 
 
-@pytest.mark.parametrize(
+@support.parametrize(
     ('input_s', 'expected'),
     (
         (INPUT_S, EXPECTED),
@@ -46,6 +55,7 @@ EXPECTED = 2
 )
 def test(input_s: str, expected: int) -> None:
     assert compute(input_s) == expected
+    assert compute_stream(input_s.splitlines()) == expected
 
 
 def main() -> int:
@@ -1,18 +1,20 @@
 from __future__ import annotations
 
 import argparse
+import bisect
+import operator
 import os.path
-
-import pytest
+from typing import Iterable
+from typing import NamedTuple
 
 import support
 
 INPUT_TXT = os.path.join(os.path.dirname(__file__), 'input.txt')
 
 
-def compute(s: str) -> int:
+def compute_stream(lines: Iterable[str]) -> int:
     n = 0
-    for line in s.splitlines():
+    for line in lines:
         ab, cd = line.split(',')
         a_s, b_s = ab.split('-')
         c_s, d_s = cd.split('-')
@@ -27,6 +29,49 @@ def compute(s: str) -> int:
     return n
 
 
+def compute_records(records: support.IntRecords) -> int:
+    a, b, c, d = (records.column(i) for i in range(4))
+    # a pair is disjoint when one range ends before the other starts
+    disjoint = sum(map(operator.lt, b, c)) + sum(map(operator.lt, d, a))
+    return records.rows - disjoint
+
+
+def compute(s: str) -> int:
+    records = support.parse_int_records(s.encode(), 4, signed=False)
+    return compute_records(records)
+
+
+class IntervalIndex(NamedTuple):
+    """the sections shared by each overlapping pair, sorted for queries"""
+    starts: list[int]
+    ends: list[int]
+
+    @classmethod
+    def from_records(cls, records: support.IntRecords) -> IntervalIndex:
+        overlaps = [
+            (max(a, c), min(b, d))
+            for a, b, c, d in records.records()
+            if a <= d and c <= b
+        ]
+        return cls(
+            sorted(start for start, _ in overlaps),
+            sorted(end for _, end in overlaps),
+        )
+
+    @classmethod
+    def parse(cls, s: str) -> IntervalIndex:
+        records = support.parse_int_records(s.encode(), 4, signed=False)
+        return cls.from_records(records)
+
+    def overlapping(self, start: int, end: int) -> int:
+        """how many pairs overlap somewhere in sections `start`-`end`"""
+        if start > end:
+            raise ValueError(f'empty section range: {start}-{end}')
+        # every overlap starting by `end` counts, except those over by `start`
+        started = bisect.bisect_right(self.starts, end)
+        return started - bisect.bisect_left(self.ends, start)
+
+
 INPUT_S = '''\
 2-4,6-8
 2-3,4-5
@@ -38,7 +83,7 @@ INPUT_S = '''\
 EXPECTED = 4
 
 
-@pytest.mark.parametrize(
+@support.parametrize(
     ('input_s', 'expected'),
     (
         (INPUT_S, EXPECTED),
@@ -46,15 +91,60 @@ EXPECTED = 4
 )
 def test(input_s: str, expected: int) -> None:
     assert compute(input_s) == expected
+    assert compute_stream(input_s.splitlines()) == expected
+
+
+@support.parametrize(
+    ('start', 'end', 'expected'),
+    (
+        (1, 2, 0),
+        (1, 99, 4),
+        (4, 4, 2),
+        (6, 6, 3),
+        (7, 7, 2),
+        (7, 9, 2),
+        (8, 9, 0),
+    ),
+)
+def test_interval_index(start: int, end: int, expected: int) -> None:
+    assert IntervalIndex.parse(INPUT_S).overlapping(start, end) == expected
+
+
+def test_interval_index_reversed_range() -> None:
+    import pytest
+
+    with pytest.raises(ValueError):
+        IntervalIndex.parse(INPUT_S).overlapping(5, 3)
+
+
+def _section_range(s: str) -> tuple[int, int]:
+    start_s, _, end_s = s.partition('-')
+    start, end = int(start_s), int(end_s)
+    if start > end:
+        raise argparse.ArgumentTypeError(f'empty section range: {s}')
+    return start, end
 
 
 def main() -> int:
     parser = argparse.ArgumentParser()
     parser.add_argument('data_file', nargs='?', default=INPUT_TXT)
+    parser.add_argument(
+        '--query', type=_section_range, action='append', default=[],
+        metavar='START-END',
+        help='also count the pairs overlapping within these sections',
+    )
     args = parser.parse_args()
 
     with open(args.data_file) as f, support.timing():
-        print(compute(f.read()))
+        records = support.parse_int_records(f.read().encode(), 4, signed=False)
+        print(compute_records(records))
+
+    if args.query:
+        with support.timing('index'):
+            index = IntervalIndex.from_records(records)
+        with support.timing('queries'):
+            for start, end in args.query:
+                print(f'{start}-{end}: {index.overlapping(start, end)}')
 
     return 0
 
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import random
+import string
+from typing import Generator
+
+import support
+
+STACKS = 9
+
+
+def generate(size: int, rand: random.Random) -> Generator[str, None, None]:
+    heights = [rand.randint(1, 8) for _ in range(STACKS)]
+    for row in range(max(heights), 0, -1):
+        crates = (
+            f'[{rand.choice(string.ascii_uppercase)}]' if h >= row else '   '
+            for h in heights
+        )
+        yield f'{" ".join(crates).rstrip()}\n'
+    yield f' {"   ".join(str(i) for i in range(1, STACKS + 1))} \n'
+    yield '\n'
+
+    n = 0
+    while n < size:
+        src = rand.choice([i for i, h in enumerate(heights) if h])
+        dst = rand.choice([i for i in range(STACKS) if i != src])
+        count = rand.randint(1, heights[src])
+        heights[src] -= count
+        heights[dst] += count
+
+        line = f'move {count} from {src + 1} to {dst + 1}\n'
+        yield line
+        n += len(line)
+
+
+def test() -> None:
+    from day05 import part1
+    from day05 import part2
+
+    s = support.generate_input(generate, 1024)
+    drawing, moves = s.split('\n\n')
+    *rows, numbers = drawing.splitlines()
+    assert numbers.split() == [str(i) for i in range(1, STACKS + 1)]
+    heights = [
+        sum(row[i * 4 + 1:i * 4 + 2].strip() != '' for row in rows)
+        for i in range(STACKS)
+    ]
+    for line in moves.splitlines():
+        _, count_s, _, src_s, _, dst_s = line.split()
+        heights[int(src_s) - 1] -= int(count_s)
+        heights[int(dst_s) - 1] += int(count_s)
+        assert heights[int(src_s) - 1] >= 0
+    # the solvers read the label of a stack which ends up empty
+    assert part1.compute(s) == 'IGV4567P9'
+    assert part2.compute(s) == 'QBJ4567P9'
+
+
+if __name__ == '__main__':
+    raise SystemExit(support.generator_main(generate))
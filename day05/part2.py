@@ -3,8 +3,6 @@ from __future__ import annotations
 import argparse
 import os.path
 
-import pytest
-
 import support
 
 INPUT_TXT = os.path.join(os.path.dirname(__file__), 'input.txt')
@@ -51,7 +49,7 @@ move 1 from 1 to 2
 EXPECTED = 'MCD'
 
 
-@pytest.mark.parametrize(
+@support.parametrize(
     ('input_s', 'expected'),
     (
         (INPUT_S, EXPECTED),
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import random
+import string
+from typing import Generator
+
+import support
+
+CHUNK = 4096
+
+
+def generate(size: int, rand: random.Random) -> Generator[str, None, None]:
+    # only three distinct letters until the end so no marker appears early
+    # and the solvers have to scan the whole signal
+    marker = rand.sample(string.ascii_lowercase, 14)
+    filler = [c for c in string.ascii_lowercase if c not in marker][:3]
+    remaining = max(size - len(marker) - 1, 0)
+    while remaining:
+        chunk = min(remaining, CHUNK)
+        yield ''.join(rand.choices(filler, k=chunk))
+        remaining -= chunk
+    yield f'{"".join(marker)}\n'
+
+
+def test() -> None:
+    from day06 import part1
+    from day06 import part2
+
+    s = support.generate_input(generate, 1024)
+    assert len(s) == 1024
+    # the marker may start with the last few filler letters
+    assert 1024 - 14 <= part1.compute(s) <= 1024 - 11
+    assert 1024 - 4 <= part2.compute(s) <= 1024 - 1
+
+
+if __name__ == '__main__':
+    raise SystemExit(support.generator_main(generate))
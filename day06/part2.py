@@ -4,8 +4,6 @@ import argparse
 import collections
 import os.path
 
-import pytest
-
 import support
 
 INPUT_TXT = os.path.join(os.path.dirname(__file__), 'input.txt')
@@ -29,7 +27,7 @@ mjqjpqmgbljsphdztnvjfqwrcgsmlb
 EXPECTED = 19
 
 
-@pytest.mark.parametrize(
+@support.parametrize(
     ('input_s', 'expected'),
     (
         (INPUT_S, EXPECTED),
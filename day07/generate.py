@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import math
+import random
+import string
+from typing import Generator
+
+import support
+
+
+def _name(rand: random.Random) -> str:
+    return ''.join(rand.choices(string.ascii_lowercase, k=rand.randint(3, 8)))
+
+
+def generate(size: int, rand: random.Random) -> Generator[str, None, None]:
+    # deep enough that the tree (~2.5 subdirs each) can fill `size`
+    max_depth = max(2, round(math.log(max(size, 1) / 60, 2.5)))
+
+    n = 0
+    todo: list[tuple[int, list[str]]] = [(0, ['/'])]
+    while todo and n < size:
+        depth, names = todo[-1]
+        if not names:
+            todo.pop()
+            if todo:
+                lines = ['$ cd ..']
+            else:
+                break
+        else:
+            lines = [f'$ cd {names.pop()}', '$ ls']
+            subdirs = set()
+            if depth < max_depth:
+                subdirs = {_name(rand) for _ in range(rand.randint(1, 4))}
+            files = {
+                f'{_name(rand)}.{rand.choice(("txt", "dat", "log", ""))}'
+                for _ in range(rand.randint(1, 5))
+            }
+            lines.extend(f'dir {subdir}' for subdir in sorted(subdirs))
+            lines.extend(
+                f'{rand.randint(1000, 300000)} {filename.rstrip(".")}'
+                for filename in sorted(files - subdirs)
+            )
+            todo.append((depth + 1, sorted(subdirs)))
+
+        chunk = ''.join(f'{line}\n' for line in lines)
+        yield chunk
+        n += len(chunk)
+
+
+def test() -> None:
+    from day07 import part1
+    from day07 import part2
+
+    s = support.generate_input(generate, 1024)
+    assert s.startswith('$ cd /\n$ ls\n')
+    # every directory is listed before it is entered
+    pwd: list[str] = []
+    listed: set[tuple[str, ...]] = {('/',)}
+    for line in s.splitlines():
+        if line == '$ cd ..':
+            pwd.pop()
+        elif line.startswith('$ cd '):
+            pwd.append(line[len('$ cd '):])
+            assert tuple(pwd) in listed
+        elif line.startswith('dir '):
+            listed.add((*pwd, line[len('dir '):]))
+    assert part1.compute(s) == 79024
+    # the disk is nowhere near full, so a directory which is never entered
+    # (and so is empty) is big enough to delete
+    assert part2.compute(s) == 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(support.generator_main(generate))
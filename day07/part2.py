@@ -3,8 +3,6 @@ from __future__ import annotations
 import argparse
 import os.path
 
-import pytest
-
 import support
 
 INPUT_TXT = os.path.join(os.path.dirname(__file__), 'input.txt')
@@ -87,7 +85,7 @@ $ ls
 EXPECTED = 24933642
 
 
-@pytest.mark.parametrize(
+@support.parametrize(
     ('input_s', 'expected'),
     (
         (INPUT_S, EXPECTED),
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import random
+from typing import Generator
+
+import support
+
+
+def generate(size: int, rand: random.Random) -> Generator[str, None, None]:
+    width = max(2, int(size ** .5))
+    for _ in range(width):
+        yield f'{"".join(rand.choices("0123456789", k=width - 1))}\n'
+
+
+def test() -> None:
+    from day08 import part1
+    from day08 import part2
+
+    s = support.generate_input(generate, 1024)
+    lines = s.splitlines()
+    assert len(lines) == 32
+    assert {len(line) for line in lines} == {31}
+    visible = part1.compute(s)
+    # every tree on the edge is visible
+    assert visible >= 2 * 32 + 2 * 31 - 4
+    assert visible == 280
+    assert part2.compute(s) == 16560
+
+
+if __name__ == '__main__':
+    raise SystemExit(support.generator_main(generate))
@@ -3,59 +3,35 @@ from __future__ import annotations
 import argparse
 import os.path
 
-import pytest
-
 import support
 
 INPUT_TXT = os.path.join(os.path.dirname(__file__), 'input.txt')
 
 
+def compute_grid(grid: support.ByteGrid) -> int:
+    data, width, height, stride = grid
+    visible = bytearray(len(data))
+
+    def _scan(start: int, step: int, count: int) -> None:
+        tallest = -1
+        for i in range(start, start + step * count, step):
+            if data[i] > tallest:
+                visible[i] = 1
+                tallest = data[i]
+
+    for y in range(height):
+        _scan(y * stride, 1, width)  # right
+        _scan(y * stride + width - 1, -1, width)  # left
+
+    for x in range(width):
+        _scan(x, stride, height)  # down
+        _scan((height - 1) * stride + x, -stride, height)  # up
+
+    return sum(visible)
+
+
 def compute(s: str) -> int:
-    coords = support.parse_coords_int(s)
-    visible = set()
-
-    y_min, x_min = min(coords)
-    y_max, x_max = max(coords)
-
-    for y in range(y_min, y_max + 1):
-        # down
-        val = coords[(y, x_min)]
-        visible.add((y, x_min))
-        for x in range(x_min + 1, x_max + 1):
-            cand = (y, x)
-            if coords[cand] > val:
-                visible.add(cand)
-                val = coords[cand]
-
-        # up
-        val = coords[(y, x_max)]
-        visible.add((y, x_max))
-        for x in range(x_max, -1, -1):
-            cand = (y, x)
-            if coords[cand] > val:
-                visible.add(cand)
-                val = coords[cand]
-
-    for x in range(x_min, x_max + 1):
-        # right
-        val = coords[(y_min, x)]
-        visible.add((y_min, x))
-        for y in range(y_min + 1, y_max + 1):
-            cand = (y, x)
-            if coords[cand] > val:
-                visible.add(cand)
-                val = coords[cand]
-
-        # left
-        val = coords[(y_max, x)]
-        visible.add((y_max, x))
-        for y in range(y_max, -1, -1):
-            cand = (y, x)
-            if coords[cand] > val:
-                visible.add(cand)
-                val = coords[cand]
-
-    return len(visible)
+    return compute_grid(support.parse_grid_bytes(s.encode()))
 
 
 INPUT_S = '''\
@@ -68,7 +44,7 @@ INPUT_S = '''\
 EXPECTED = 21
 
 
-@pytest.mark.parametrize(
+@support.parametrize(
     ('input_s', 'expected'),
     (
         (INPUT_S, EXPECTED),
@@ -83,8 +59,8 @@ def main() -> int:
     parser.add_argument('data_file', nargs='?', default=INPUT_TXT)
     args = parser.parse_args()
 
-    with open(args.data_file) as f, support.timing():
-        print(compute(f.read()))
+    with support.mmap_grid(args.data_file) as grid, support.timing():
+        print(compute_grid(grid))
 
     return 0
 
@@ -3,55 +3,41 @@ from __future__ import annotations
 import argparse
 import os.path
 
-import pytest
-
 import support
 
 INPUT_TXT = os.path.join(os.path.dirname(__file__), 'input.txt')
 
 
-def compute(s: str) -> int:
-    coords = support.parse_coords_int(s)
-
-    y_min, x_min = min(coords)
-    y_max, x_max = max(coords)
+def compute_grid(grid: support.ByteGrid) -> int:
+    data, width, height, stride = grid
 
     val = -1
+    for y in range(height):
+        for x in range(width):
+            i = y * stride + x
+            n = data[i]
+
+            score = 1
+            for step, count in (
+                    (-stride, y),  # up
+                    (stride, height - 1 - y),  # down
+                    (-1, x),  # left
+                    (1, width - 1 - x),  # right
+            ):
+                seen = 0
+                for j in range(i + step, i + step * (count + 1), step):
+                    seen += 1
+                    if data[j] >= n:
+                        break
+                score *= seen
+
+            val = max(score, val)
 
-    def coords_compute(x: int, y: int) -> int:
-        n = coords[(y, x)]
-
-        up = 0
-        for cand_y in range(y - 1, y_min - 1, -1):
-            up += 1
-            if coords[(cand_y, x)] >= n:
-                break
-
-        down = 0
-        for cand_y in range(y + 1, y_max + 1):
-            down += 1
-            if coords[(cand_y, x)] >= n:
-                break
-
-        left = 0
-        for cand_x in range(x - 1, x_min - 1, -1):
-            left += 1
-            if coords[(y, cand_x)] >= n:
-                break
-
-        right = 0
-        for cand_x in range(x + 1, x_max + 1):
-            right += 1
-            if coords[(y, cand_x)] >= n:
-                break
-
-        return up * down * left * right
+    return val
 
-    for y in range(y_min, y_max + 1):
-        for x in range(x_min, x_max + 1):
-            val = max(coords_compute(x, y), val)
 
-    return val
+def compute(s: str) -> int:
+    return compute_grid(support.parse_grid_bytes(s.encode()))
 
 
 INPUT_S = '''\
@@ -64,7 +50,7 @@ INPUT_S = '''\
 EXPECTED = 8
 
 
-@pytest.mark.parametrize(
+@support.parametrize(
     ('input_s', 'expected'),
     (
         (INPUT_S, EXPECTED),
@@ -79,8 +65,8 @@ def main() -> int:
     parser.add_argument('data_file', nargs='?', default=INPUT_TXT)
     args = parser.parse_args()
 
-    with open(args.data_file) as f, support.timing():
-        print(compute(f.read()))
+    with support.mmap_grid(args.data_file) as grid, support.timing():
+        print(compute_grid(grid))
 
     return 0
 
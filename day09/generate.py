@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import random
+from typing import Generator
+
+import support
+
+
+def generate(size: int, rand: random.Random) -> Generator[str, None, None]:
+    n = 0
+    while n < size:
+        line = f'{rand.choice("UDLR")} {rand.randint(1, 20)}\n'
+        yield line
+        n += len(line)
+
+
+def test() -> None:
+    from day09 import part1
+    from day09 import part2
+
+    s = support.generate_input(generate, 1024)
+    for line in s.splitlines():
+        direction, n_s = line.split()
+        assert direction in 'UDLR'
+        assert 1 <= int(n_s) <= 20
+    assert part1.compute(s) == 1655
+    assert part2.compute(s) == 1004
+
+
+if __name__ == '__main__':
+    raise SystemExit(support.generator_main(generate))
@@ -2,8 +2,7 @@ from __future__ import annotations
 
 import argparse
 import os.path
-
-import pytest
+from typing import Iterable
 
 import support
 
@@ -17,11 +16,11 @@ DIRECTION_MAP = {
 }
 
 
-def compute(s: str) -> int:
+def compute_stream(lines: Iterable[str]) -> int:
     head = tail = (0, 0)
     seen = {tail}
 
-    for line in s.splitlines():
+    for line in lines:
         dir_s, n_s = line.split()
         move = DIRECTION_MAP[dir_s]
 
@@ -34,6 +33,10 @@ def compute(s: str) -> int:
     return len(seen)
 
 
+def compute(s: str) -> int:
+    return compute_stream(s.splitlines())
+
+
 INPUT_S = '''\
 R 4
 U 4
@@ -47,7 +50,7 @@ R 2
 EXPECTED = 13
 
 
-@pytest.mark.parametrize(
+@support.parametrize(
     ('input_s', 'expected'),
     (
         (INPUT_S, EXPECTED),
@@ -63,7 +66,7 @@ def main() -> int:
     args = parser.parse_args()
 
     with open(args.data_file) as f, support.timing():
-        print(compute(f.read()))
+        print(compute_stream(support.iter_lines(f)))
 
     return 0
 
@@ -2,8 +2,7 @@ from __future__ import annotations
 
 import argparse
 import os.path
-
-import pytest
+from typing import Iterable
 
 import support
 
@@ -31,11 +30,11 @@ def fixup(head: tuple[int, int], tail: tuple[int, int]) -> tuple[int, int]:
         return tail
 
 
-def compute(s: str) -> int:
+def compute_stream(lines: Iterable[str]) -> int:
     positions = [(0, 0)] * 10
     seen = {positions[0]}
 
-    for line in s.splitlines():
+    for line in lines:
         dir_s, n_s = line.split()
         move = DIRECTION_MAP[dir_s]
 
@@ -52,6 +51,10 @@ def compute(s: str) -> int:
     return len(seen)
 
 
+def compute(s: str) -> int:
+    return compute_stream(s.splitlines())
+
+
 INPUT_S = '''\
 R 5
 U 8
@@ -65,7 +68,7 @@ U 20
 EXPECTED = 36
 
 
-@pytest.mark.parametrize(
+@support.parametrize(
     ('input_s', 'expected'),
     (
         (INPUT_S, EXPECTED),
@@ -81,7 +84,7 @@ def main() -> int:
     args = parser.parse_args()
 
     with open(args.data_file) as f, support.timing():
-        print(compute(f.read()))
+        print(compute_stream(support.iter_lines(f)))
 
     return 0
 
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import random
+from typing import Generator
+
+import support
+
+# the crt needs at least this many cycles of instructions
+MIN_CYCLES = 240
+
+
+def generate(size: int, rand: random.Random) -> Generator[str, None, None]:
+    x = 1
+    n = cycles = 0
+    while n < size or cycles < MIN_CYCLES:
+        if rand.random() < .3:
+            line = 'noop\n'
+            cycles += 1
+        else:
+            v = rand.randint(max(-x, -20), min(39 - x, 20)) or 1
+            x += v
+            line = f'addx {v}\n'
+            cycles += 2
+        yield line
+        n += len(line)
+
+
+def test() -> None:
+    from day10 import part1
+    from day10 import part2
+
+    s = support.generate_input(generate, 1024)
+    x = 1
+    cycles = 0
+    for line in s.splitlines():
+        if line == 'noop':
+            cycles += 1
+        else:
+            x += int(line.split()[1])
+            cycles += 2
+        # the sprite never leaves the 40 pixel wide screen
+        assert 0 <= x <= 39
+    assert cycles >= MIN_CYCLES
+    assert part1.compute(s) == 17100
+    screen = part2.compute(s).splitlines()
+    assert len(screen) <= 6
+    assert max(len(line) for line in screen) <= 40
+    assert sum(line.count('#') for line in screen) == 18
+
+
+if __name__ == '__main__':
+    raise SystemExit(support.generator_main(generate))
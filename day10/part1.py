@@ -2,8 +2,7 @@ from __future__ import annotations
 
 import argparse
 import os.path
-
-import pytest
+from typing import Iterable
 
 import support
 
@@ -12,17 +11,17 @@ INPUT_TXT = os.path.join(os.path.dirname(__file__), 'input.txt')
 TARGET_CYCLES = {20, 60, 100, 140, 180, 220}
 
 
-def compute(s: str) -> int:
+def compute_stream(lines: Iterable[str]) -> int:
     result_sum = 0
 
     x = 1
-    lines = iter(s.splitlines())
+    instructions = iter(lines)
     instr_n = 0
     instr = 'noop'
 
     for i in range(1, max(TARGET_CYCLES) + 1):
         if instr_n == 0:
-            instr = next(lines)
+            instr = next(instructions)
             if instr == 'noop':
                 instr_n = 1
             elif instr.startswith('addx '):
@@ -41,6 +40,10 @@ def compute(s: str) -> int:
     return result_sum
 
 
+def compute(s: str) -> int:
+    return compute_stream(s.splitlines())
+
+
 INPUT_S = '''\
 addx 15
 addx -11
@@ -192,7 +195,7 @@ noop
 EXPECTED = 13140
 
 
-@pytest.mark.parametrize(
+@support.parametrize(
     ('input_s', 'expected'),
     (
         (INPUT_S, EXPECTED),
@@ -208,7 +211,7 @@ def main() -> int:
     args = parser.parse_args()
 
     with open(args.data_file) as f, support.timing():
-        print(compute(f.read()))
+        print(compute_stream(support.iter_lines(f)))
 
     return 0
 
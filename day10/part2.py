@@ -2,25 +2,24 @@ from __future__ import annotations
 
 import argparse
 import os.path
-
-import pytest
+from typing import Iterable
 
 import support
 
 INPUT_TXT = os.path.join(os.path.dirname(__file__), 'input.txt')
 
 
-def compute(s: str) -> str:
+def compute_stream(lines: Iterable[str]) -> str:
     pixels = set()
 
     x = 1
-    lines = iter(s.splitlines())
+    instructions = iter(lines)
     instr_n = 0
     instr = 'noop'
 
     for i in range(1, 240 + 1):
         if instr_n == 0:
-            instr = next(lines)
+            instr = next(instructions)
             if instr == 'noop':
                 instr_n = 1
             elif instr.startswith('addx '):
@@ -39,6 +38,10 @@ def compute(s: str) -> str:
     return support.format_coords_hash(pixels).replace(' ', '.')
 
 
+def compute(s: str) -> str:
+    return compute_stream(s.splitlines())
+
+
 INPUT_S = '''\
 addx 15
 addx -11
@@ -197,7 +200,7 @@ EXPECTED = '''\
 '''.rstrip()
 
 
-@pytest.mark.parametrize(
+@support.parametrize(
     ('input_s', 'expected'),
     (
         (INPUT_S, EXPECTED),
@@ -213,7 +216,7 @@ def main() -> int:
     args = parser.parse_args()
 
     with open(args.data_file) as f, support.timing():
-        print(compute(f.read()))
+        print(compute_stream(support.iter_lines(f)))
 
     return 0
 
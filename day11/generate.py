@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import random
+from typing import Generator
+
+import support
+
+PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23)
+
+
+def generate(size: int, rand: random.Random) -> Generator[str, None, None]:
+    monkeys = max(3, size // 180)
+    # only one monkey squares, and nothing is thrown back to it: part 1 has
+    # no modulus, so items squared again and again grow into huge numbers
+    squares = rand.randrange(monkeys)
+    for i in range(monkeys):
+        items = ', '.join(
+            str(rand.randint(50, 99)) for _ in range(rand.randint(1, 8))
+        )
+        if i == squares:
+            op = 'old * old'
+        else:
+            op = f'old {rand.choice("+*")} {rand.randint(1, 9)}'
+        # never throw to ourselves, nor to the squaring monkey
+        others = [j for j in range(monkeys) if j not in (i, squares)]
+        targets = [rand.choice(others) for _ in range(2)]
+        if i:
+            yield '\n'
+        yield (
+            f'Monkey {i}:\n'
+            f'  Starting items: {items}\n'
+            f'  Operation: new = {op}\n'
+            f'  Test: divisible by {PRIMES[i % len(PRIMES)]}\n'
+            f'    If true: throw to monkey {targets[0]}\n'
+            f'    If false: throw to monkey {targets[1]}\n'
+        )
+
+
+def test() -> None:
+    from day11 import part1
+    from day11 import part2
+
+    s = support.generate_input(generate, 2048)
+    ops = [
+        line.split(' = ')[1]
+        for line in s.splitlines()
+        if line.startswith('  Operation:')
+    ]
+    assert len(ops) == 2048 // 180
+    assert ops.count('old * old') == 1
+    assert f'throw to monkey {ops.index("old * old")}\n' not in s
+    assert part1.compute(s) == 350428
+    assert part2.compute(s) == 358124449216
+
+
+if __name__ == '__main__':
+    raise SystemExit(support.generator_main(generate))
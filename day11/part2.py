@@ -7,8 +7,6 @@ import os.path
 from typing import Callable
 from typing import NamedTuple
 
-import pytest
-
 import support
 
 INPUT_TXT = os.path.join(os.path.dirname(__file__), 'input.txt')
@@ -105,7 +103,7 @@ Monkey 3:
 EXPECTED = 2713310158
 
 
-@pytest.mark.parametrize(
+@support.parametrize(
     ('input_s', 'expected'),
     (
         (INPUT_S, EXPECTED),
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import itertools
+import random
+import string
+from typing import Generator
+
+import support
+
+
+def generate(size: int, rand: random.Random) -> Generator[str, None, None]:
+    width = max(30, int(size ** .5))
+    height = max(1, size // (width + 1))
+
+    # neighbouring cells never differ by more than one so every cell can
+    # reach the summit: rise left to right with a meandering per-row offset
+    offset = 0
+    for y in range(height):
+        row = [
+            string.ascii_lowercase[min(25, max(0, x * 30 // width + offset))]
+            for x in range(width)
+        ]
+        if y == 0:
+            row[0] = 'S'
+        if y == height - 1:
+            row[-1] = 'E'
+        yield f'{"".join(row)}\n'
+        offset = min(0, max(-4, offset + rand.randint(-1, 1)))
+
+
+def test() -> None:
+    from day12 import part1
+    from day12 import part2
+
+    s = support.generate_input(generate, 1024)
+    lines = s.splitlines()
+    assert len({len(line) for line in lines}) == 1
+    assert s.count('S') == s.count('E') == 1
+    # neighbouring cells never differ by more than one
+    pairs = [
+        *(zip(line, line[1:]) for line in lines),
+        *(zip(above, below) for above, below in zip(lines, lines[1:])),
+    ]
+    for a, b in itertools.chain.from_iterable(pairs):
+        if a.islower() and b.islower():
+            assert abs(ord(a) - ord(b)) <= 1
+    assert part1.compute(s) == 61
+    assert part2.compute(s) == 29
+
+
+if __name__ == '__main__':
+    raise SystemExit(support.generator_main(generate))
@@ -1,68 +1,42 @@
 from __future__ import annotations
 
 import argparse
-import heapq
 import os.path
-import string
 from typing import TypeAlias
 
-import pytest
-
 import support
 
 INPUT_TXT = os.path.join(os.path.dirname(__file__), 'input.txt')
 
-Pair: TypeAlias = tuple[int, int]
-Graph: TypeAlias = dict[Pair, list[Pair]]
+Graph: TypeAlias = list[list[int]]
 
 
-def parse_input(s: str) -> tuple[list[str], Graph, Pair, Pair]:
+def parse_input(s: str) -> tuple[support.Grid2D, Graph, int, int]:
     """
-    Returns (grid, graph, start_point, goal_point)
-    graph is represented as a dict mapping each point (x, y)
-    to the list of points from which that point is accessible
+    Returns (grid, graph, start_index, goal_index)
+    graph is represented as a list mapping each cell index of the grid
+    to the list of cell indices from which that cell is accessible
     """
-    grid = [line.strip() for line in s.splitlines()]
-    graph: Graph = {}
-    width, height = len(grid[0]), len(grid)
-    start = goal = (0, 0)
-    elevation = dict(zip(string.ascii_lowercase, range(26)))
-    elevation.update({'S': elevation['a'], 'E': elevation['z']})
-    for y in range(height):
-        for x in range(width):
-            graph[(x, y)] = []
-            cell = grid[y][x]
-            if cell == 'S':
-                start = (x, y)
-                continue
-            if cell == 'E':
-                goal = (x, y)
-            for nx, ny in [(x - 1, y), (x + 1, y), (x, y - 1), (x, y + 1)]:
-                if 0 <= nx < width and 0 <= ny < height:
-                    if elevation[grid[ny][nx]] - elevation[cell] >= -1:
-                        graph[(x, y)].append((nx, ny))
+    grid = support.Grid2D.from_bytes(support.parse_grid_bytes(s.encode()))
+    start = grid.cells.index(b'S')
+    goal = grid.cells.index(b'E')
+    elevation = grid.cells.replace(b'S', b'a').replace(b'E', b'z')
+    graph: Graph = []
+    for i, height in enumerate(elevation):
+        if i == start:
+            graph.append([])
+        else:
+            graph.append([
+                n for n in grid.neighbors_4(i)
+                if elevation[n] - height >= -1
+            ])
     return grid, graph, start, goal
 
 
-def find_paths(graph: Graph, goal: tuple[int, int]) -> dict[Pair, int]:
-    """
-    Returns a dict mapping each point on the grid to the number of steps
-    required to move from that point to the goal.
-    """
-    q = [(0, goal)]
-    path_lengths = {goal: 0}
-    while q:
-        cost, current = heapq.heappop(q)
-        for point in graph[current]:
-            if point not in path_lengths or cost + 1 < path_lengths[point]:
-                path_lengths[point] = cost + 1
-                heapq.heappush(q, (cost + 1, point))
-    return path_lengths
-
-
 def compute(s: str) -> int:
     grid, graph, start, goal = parse_input(s)
-    path_lengths = find_paths(graph, goal)
+    # steps from each cell to the goal, walking the edges backwards
+    path_lengths = support.bfs_int(graph, (goal,))
     return path_lengths[start]
 
 
@@ -76,7 +50,7 @@ abdefghi
 EXPECTED = 31
 
 
-@pytest.mark.parametrize(
+@support.parametrize(
     ('input_s', 'expected'),
     (
         (INPUT_S, EXPECTED),
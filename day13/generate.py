@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import random
+from typing import Generator
+
+import support
+
+Packet = int | list['Packet']
+
+
+def _packet(rand: random.Random, depth: int = 0) -> list[Packet]:
+    ret: list[Packet] = []
+    for _ in range(rand.randint(0, 5)):
+        if depth < 4 and rand.random() < .3:
+            ret.append(_packet(rand, depth + 1))
+        else:
+            ret.append(rand.randint(0, 10))
+    return ret
+
+
+def _format(packet: list[Packet]) -> str:
+    return str(packet).replace(' ', '')
+
+
+def generate(size: int, rand: random.Random) -> Generator[str, None, None]:
+    n = 0
+    while n < size:
+        lhs = _packet(rand)
+        rhs = _packet(rand)
+        while rhs == lhs:
+            rhs = _packet(rand)
+        chunk = f'{_format(lhs)}\n{_format(rhs)}\n'
+        if n:
+            chunk = f'\n{chunk}'
+        yield chunk
+        n += len(chunk)
+
+
+def test() -> None:
+    import json
+
+    from day13 import part1
+    from day13 import part2
+
+    s = support.generate_input(generate, 1024)
+    for pair in s.split('\n\n'):
+        lhs, rhs = (json.loads(line) for line in pair.splitlines())
+        assert isinstance(lhs, list)
+        assert isinstance(rhs, list)
+        assert lhs != rhs
+    assert part1.compute(s) == 194
+    assert part2.compute(s) == 735
+
+
+if __name__ == '__main__':
+    raise SystemExit(support.generator_main(generate))
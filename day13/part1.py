@@ -5,8 +5,6 @@ import ast
 import itertools
 import os.path
 
-import pytest
-
 import support
 
 INPUT_TXT = os.path.join(os.path.dirname(__file__), 'input.txt')
@@ -79,7 +77,7 @@ INPUT_S = '''\
 EXPECTED = 13
 
 
-@pytest.mark.parametrize(
+@support.parametrize(
     ('input_s', 'expected'),
     (
         (INPUT_S, EXPECTED),
@@ -6,8 +6,6 @@ import functools
 import itertools
 import os.path
 
-import pytest
-
 import support
 
 INPUT_TXT = os.path.join(os.path.dirname(__file__), 'input.txt')
@@ -76,7 +74,7 @@ INPUT_S = '''\
 EXPECTED = 140
 
 
-@pytest.mark.parametrize(
+@support.parametrize(
     ('input_s', 'expected'),
     (
         (INPUT_S, EXPECTED),
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import random
+from typing import Generator
+
+import support
+
+
+def generate(size: int, rand: random.Random) -> Generator[str, None, None]:
+    # the cave gets deeper (and wider) as more rock paths are added
+    depth = max(20, int(size ** .5))
+
+    # a shelf below the source so some sand comes to rest
+    shelf = f'490,{depth // 2} -> 510,{depth // 2}\n'
+    yield shelf
+
+    n = len(shelf)
+    while n < size:
+        x, y = rand.randint(500 - depth, 500 + depth), rand.randint(2, depth)
+        points = [f'{x},{y}']
+        for i in range(rand.randint(1, 5)):
+            if i % 2 == 0:
+                x = min(500 + depth, max(500 - depth, x + rand.randint(-8, 8)))
+            else:
+                y = min(depth, max(2, y + rand.randint(-8, 8)))
+            points.append(f'{x},{y}')
+        line = f'{" -> ".join(points)}\n'
+        yield line
+        n += len(line)
+
+
+def test() -> None:
+    from day14 import part1
+    from day14 import part2
+
+    s = support.generate_input(generate, 1024)
+    shelf, *paths = s.splitlines()
+    assert shelf == '490,16 -> 510,16'
+    for path in paths:
+        points = [
+            support.parse_point_comma(point) for point in path.split(' -> ')
+        ]
+        # rock paths are straight lines, alternating horizontal and vertical
+        for (x0, y0), (x1, y1) in zip(points, points[1:]):
+            assert x0 == x1 or y0 == y1
+    assert part1.compute(s) == 139
+    assert part2.compute(s) == 512
+
+
+if __name__ == '__main__':
+    raise SystemExit(support.generator_main(generate))
@@ -3,8 +3,6 @@ from __future__ import annotations
 import argparse
 import os.path
 
-import pytest
-
 import support
 
 INPUT_TXT = os.path.join(os.path.dirname(__file__), 'input.txt')
@@ -14,11 +12,10 @@ SAND_PT = (500, 0)
 
 def compute(s: str) -> int:
     coords = set()
-    for line in s.splitlines():
-        points = line.split(' -> ')
-        prev_x, prev_y = support.parse_point_comma(points[0])
-        for point in points[1:]:
-            cand_x, cand_y = support.parse_point_comma(point)
+    for line in s.encode().splitlines():
+        xys = support.parse_points_array(line, signed=False)
+        prev_x, prev_y = xys[0], xys[1]
+        for cand_x, cand_y in zip(xys[2::2], xys[3::2]):
             if cand_x == prev_x:
                 for y in range(min(cand_y, prev_y), max(cand_y, prev_y) + 1):
                     coords.add((cand_x, y))
@@ -29,24 +26,34 @@ def compute(s: str) -> int:
 
     max_y = max(y for _, y in coords)
 
+    # sand spreads at most one column per row so this covers the whole pile
+    sand_x, sand_y = SAND_PT
+    grid = support.Grid2D(
+        2 * max_y + 5, max_y + 3, x_min=sand_x - max_y - 2, y_min=sand_y,
+    )
+    for pt in coords:
+        if pt in grid:
+            grid.cells[grid.index(*pt)] = 1
+    cells, width = grid.cells, grid.width
+    source = grid.index(*SAND_PT)
+    abyss = grid.index(grid.x_min, max_y + 1)
+
     i = 0
 
     while True:
-        px, py = SAND_PT
+        p = source
         while True:
-            if (px, py + 1) not in coords:
-                py += 1
-            elif (px - 1, py + 1) not in coords:
-                px -= 1
-                py += 1
-            elif (px + 1, py + 1) not in coords:
-                px += 1
-                py += 1
+            if not cells[p + width]:
+                p += width
+            elif not cells[p + width - 1]:
+                p += width - 1
+            elif not cells[p + width + 1]:
+                p += width + 1
             else:
-                coords.add((px, py))
+                cells[p] = 1
                 break
 
-            if py > max_y:
+            if p >= abyss:
                 return i
 
         i += 1
@@ -59,7 +66,7 @@ INPUT_S = '''\
 EXPECTED = 24
 
 
-@pytest.mark.parametrize(
+@support.parametrize(
     ('input_s', 'expected'),
     (
         (INPUT_S, EXPECTED),
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import random
+from typing import Generator
+
+import support
+
+MAX = 4_000_000
+
+
+def generate(size: int, rand: random.Random) -> Generator[str, None, None]:
+    n = 0
+    while n < size:
+        x, y = rand.randint(0, MAX), rand.randint(0, MAX)
+        dx = rand.randint(-200_000, 200_000)
+        dy = rand.randint(-200_000, 200_000)
+        line = (
+            f'Sensor at x={x}, y={y}: '
+            f'closest beacon is at x={x + dx}, y={y + dy}\n'
+        )
+        yield line
+        n += len(line)
+
+
+def test() -> None:
+    from day15 import part1
+    from day15 import part2
+
+    s = support.generate_input(generate, 1024)
+    records = support.parse_int_records(s.encode(), 4)
+    assert records.rows == len(s.splitlines())
+    for sensor_x, sensor_y, beacon_x, beacon_y in records.records():
+        assert 0 <= sensor_x <= MAX
+        assert 0 <= sensor_y <= MAX
+        assert abs(beacon_x - sensor_x) <= 200_000
+        assert abs(beacon_y - sensor_y) <= 200_000
+    # the default row is rarely covered by so few sensors, use the first's
+    assert part1.compute(s, y=records.row(0)[1]) == 435773
+    assert part2.compute(s) == 14167045397948
+
+
+if __name__ == '__main__':
+    raise SystemExit(support.generator_main(generate))
@@ -2,20 +2,12 @@ from __future__ import annotations
 
 import argparse
 import os.path
-import re
 from typing import NamedTuple
 
-import pytest
-
 import support
 
 INPUT_TXT = os.path.join(os.path.dirname(__file__), 'input.txt')
 
-reg = re.compile(
-    r'^Sensor at x=(-?\d+), y=(-?\d+): '
-    r'closest beacon is at x=(-?\d+), y=(-?\d+)$',
-)
-
 
 class Sensor(NamedTuple):
     x: int
@@ -35,13 +27,8 @@ def compute(s: str, m: int = 4000000) -> int:
     beacons = set()
 
     sensors = []
-    for line in s.splitlines():
-        match = reg.match(line)
-        assert match is not None
-        sensor = Sensor(
-            int(match[1]), int(match[2]),
-            int(match[3]), int(match[4]),
-        )
+    records = support.parse_int_records(s.encode(), 4)
+    for sensor in map(Sensor._make, records.records()):
         sensors.append(sensor)
         beacons.add((sensor.beacon_x, sensor.beacon_y))
 
@@ -89,7 +76,7 @@ Sensor at x=20, y=1: closest beacon is at x=15, y=3
 EXPECTED = 56000011
 
 
-@pytest.mark.parametrize(
+@support.parametrize(
     ('input_s', 'expected'),
     (
         (INPUT_S, EXPECTED),
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import math
+import random
+import string
+from typing import Generator
+
+import support
+
+# the solvers are exponential in the number of working valves so only the
+# tunnel network grows with `size`
+MAX_WORKING = 15
+
+
+def _names(n: int) -> list[str]:
+    width = max(2, math.ceil(math.log(n, 26)))
+    names = ['AA']
+    for i in range(1, n):
+        name = ''
+        for _ in range(width):
+            i, c = divmod(i, 26)
+            name = f'{string.ascii_uppercase[c]}{name}'
+        names.append(name)
+    return names
+
+
+def generate(size: int, rand: random.Random) -> Generator[str, None, None]:
+    names = _names(max(2, size // 55))
+
+    edges: dict[str, set[str]] = {name: set() for name in names}
+    # a random spanning tree keeps every valve reachable, then a few cycles
+    for i, name in enumerate(names[1:], 1):
+        other = names[rand.randrange(i)]
+        edges[name].add(other)
+        edges[other].add(name)
+    for _ in range(len(names) // 4):
+        a, b = rand.sample(names, 2)
+        edges[a].add(b)
+        edges[b].add(a)
+
+    working = rand.sample(names[1:], min(MAX_WORKING, len(names) - 1))
+    rates = {name: rand.randint(1, 25) for name in working}
+
+    for name in names:
+        targets = sorted(edges[name])
+        if len(targets) == 1:
+            tunnels = f'tunnel leads to valve {targets[0]}'
+        else:
+            tunnels = f'tunnels lead to valves {", ".join(targets)}'
+        yield (
+            f'Valve {name} has flow rate={rates.get(name, 0)}; {tunnels}\n'
+        )
+
+
+def test() -> None:
+    from day16 import part1
+    from day16 import part2
+
+    s = support.generate_input(generate, 512)
+    names = [line.split()[1] for line in s.splitlines()]
+    assert names[0] == 'AA'
+    assert len(set(names)) == len(names)
+    working = [line for line in s.splitlines() if 'rate=0;' not in line]
+    assert len(working) == min(MAX_WORKING, len(names) - 1)
+    assert part1.compute(s) == 2234
+    assert part2.compute(s) == 2155
+
+
+if __name__ == '__main__':
+    raise SystemExit(support.generator_main(generate))
@@ -1,13 +1,9 @@
 from __future__ import annotations
 
 import argparse
-import collections
-import itertools
 import os.path
 import re
 
-import pytest
-
 import support
 
 INPUT_TXT = os.path.join(os.path.dirname(__file__), 'input.txt')
@@ -41,18 +37,12 @@ def compute(s: str) -> int:
     weights = {}
     positive_rates = frozenset(k for k, v in rates.items() if v)
     meaningful_edges = ['AA', *positive_rates]
-    for a, b in itertools.combinations(meaningful_edges, r=2):
-        todo_bfs: collections.deque[tuple[str, ...]]
-        todo_bfs = collections.deque([(a,)])
-        path: tuple[str, ...] = tuple()
-        while todo_bfs:
-            path = todo_bfs.popleft()
-            if path[-1] == b:
-                break
-            else:
-                todo_bfs.extend((*path, n) for n in edges[path[-1]])
-        weights[(a, b)] = len(path)
-        weights[(b, a)] = len(path)
+    for a in meaningful_edges:
+        steps = support.bfs((a,), edges.__getitem__)
+        for b in meaningful_edges:
+            if a != b:
+                # one more minute to open the valve
+                weights[(a, b)] = steps[b] + 1
 
     # time to total
     best = -1
@@ -60,6 +50,7 @@ def compute(s: str) -> int:
     todo = [(0, 0, ('AA',), positive_rates)]
     while todo:
         score, time, route, possible = todo.pop()
+        support.count('todo pops')
         best = max(best, score)
 
         for p in possible:
@@ -90,7 +81,7 @@ Valve JJ has flow rate=21; tunnel leads to valve II
 EXPECTED = 1651
 
 
-@pytest.mark.parametrize(
+@support.parametrize(
     ('input_s', 'expected'),
     (
         (INPUT_S, EXPECTED),
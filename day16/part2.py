@@ -1,13 +1,10 @@
 from __future__ import annotations
 
 import argparse
-import collections
 import itertools
 import os.path
 import re
 
-import pytest
-
 import support
 
 INPUT_TXT = os.path.join(os.path.dirname(__file__), 'input.txt')
@@ -41,18 +38,12 @@ def compute(s: str) -> int:
     weights = {}
     positive_rates = frozenset(k for k, v in rates.items() if v)
     meaningful_edges = ['AA', *positive_rates]
-    for a, b in itertools.combinations(meaningful_edges, r=2):
-        todo_bfs: collections.deque[tuple[str, ...]]
-        todo_bfs = collections.deque([(a,)])
-        path: tuple[str, ...] = tuple()
-        while todo_bfs:
-            path = todo_bfs.popleft()
-            if path[-1] == b:
-                break
-            else:
-                todo_bfs.extend((*path, n) for n in edges[path[-1]])
-        weights[(a, b)] = len(path)
-        weights[(b, a)] = len(path)
+    for a in meaningful_edges:
+        steps = support.bfs((a,), edges.__getitem__)
+        for b in meaningful_edges:
+            if a != b:
+                # one more minute to open the valve
+                weights[(a, b)] = steps[b] + 1
 
     # time to total
     best: dict[frozenset[str], int] = {}
@@ -60,6 +51,7 @@ def compute(s: str) -> int:
     todo = [(0, 0, ('AA',), positive_rates)]
     while todo:
         score, time, route, possible = todo.pop()
+        support.count('todo pops')
 
         route_k = frozenset(route) - {'AA'}
         best_val = best.setdefault(route_k, score)
@@ -97,7 +89,7 @@ Valve JJ has flow rate=21; tunnel leads to valve II
 EXPECTED = 1707
 
 
-@pytest.mark.parametrize(
+@support.parametrize(
     ('input_s', 'expected'),
     (
         (INPUT_S, EXPECTED),
@@ -113,7 +105,7 @@ def main() -> int:
     args = parser.parse_args()
 
     with open(args.data_file) as f, support.timing():
-        print(compute(f.read()))
+        print(support.cached_answer(compute, f.read()))
 
     return 0
 
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import random
+from typing import Generator
+
+import support
+
+CHUNK = 4096
+
+
+def generate(size: int, rand: random.Random) -> Generator[str, None, None]:
+    remaining = max(size - 1, 1)
+    while remaining:
+        chunk = min(remaining, CHUNK)
+        yield ''.join(rand.choices('<>', k=chunk))
+        remaining -= chunk
+    yield '\n'
+
+
+def test() -> None:
+    from day17 import part1
+
+    s = support.generate_input(generate, 1024)
+    assert len(s) == 1024
+    assert set(s[:-1]) == {'<', '>'}
+    assert s.endswith('\n')
+    assert part1.compute(s) == 3194
+
+
+if __name__ == '__main__':
+    raise SystemExit(support.generator_main(generate))
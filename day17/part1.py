@@ -5,8 +5,6 @@ import functools
 import itertools
 import os.path
 
-import pytest
-
 import support
 
 INPUT_TXT = os.path.join(os.path.dirname(__file__), 'input.txt')
@@ -132,7 +130,7 @@ INPUT_S = '''\
 EXPECTED = 3068
 
 
-@pytest.mark.parametrize(
+@support.parametrize(
     ('input_s', 'expected'),
     (
         (INPUT_S, EXPECTED),
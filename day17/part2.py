@@ -5,8 +5,6 @@ import functools
 import itertools
 import os.path
 
-import pytest
-
 import support
 
 INPUT_TXT = os.path.join(os.path.dirname(__file__), 'input.txt')
@@ -180,7 +178,7 @@ INPUT_S = '''\
 EXPECTED = 1514285714288
 
 
-@pytest.mark.parametrize(
+@support.parametrize(
     ('input_s', 'expected'),
     (
         (INPUT_S, EXPECTED),
@@ -196,7 +194,7 @@ def main() -> int:
     args = parser.parse_args()
 
     with open(args.data_file) as f, support.timing():
-        print(compute(f.read()))
+        print(support.cached_answer(compute, f.read()))
 
     return 0
 
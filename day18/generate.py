@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import random
+from typing import Generator
+
+import support
+
+DENSITY = .3
+
+
+def generate(size: int, rand: random.Random) -> Generator[str, None, None]:
+    # a box just large enough to hold `size` bytes of droplet
+    side = 3
+    while side ** 3 * DENSITY * (3 * len(str(side)) + 3) < size:
+        side += 1
+
+    n = 0
+    for x in range(side):
+        for y in range(side):
+            for z in range(side):
+                if rand.random() < DENSITY:
+                    line = f'{x},{y},{z}\n'
+                    yield line
+                    n += len(line)
+                    if n >= size:
+                        return
+
+
+def test() -> None:
+    from day18 import part1
+    from day18 import part2
+
+    s = support.generate_input(generate, 1024)
+    cubes = [support.parse_numbers_comma(line) for line in s.splitlines()]
+    assert len(set(map(tuple, cubes))) == len(cubes)
+    assert part1.compute(s) == 762
+    assert part2.compute(s) == 756
+
+
+if __name__ == '__main__':
+    raise SystemExit(support.generator_main(generate))
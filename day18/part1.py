@@ -3,8 +3,7 @@ from __future__ import annotations
 import argparse
 import os.path
 from typing import Generator
-
-import pytest
+from typing import Iterable
 
 import support
 
@@ -24,12 +23,16 @@ def adjacent_faces(
     yield x, y, z - 1
 
 
-def compute(s: str) -> int:
+def parse_line(line: str) -> tuple[int, int, int]:
+    x, y, z = line.split(',')
+    return int(x), int(y), int(z)
+
+
+def compute_points(points: Iterable[tuple[int, int, int]]) -> int:
     count = 0
     coords = set()
 
-    for line in s.splitlines():
-        x, y, z = map(int, line.split(','))
+    for x, y, z in points:
         count += 6
         for cx, cy, cz in adjacent_faces(x, y, z):
             if (cx, cy, cz) in coords:
@@ -39,6 +42,15 @@ def compute(s: str) -> int:
     return count
 
 
+def compute_stream(lines: Iterable[str]) -> int:
+    return compute_points(map(parse_line, lines))
+
+
+def compute(s: str) -> int:
+    xyz = support.parse_points_array(s.encode(), 3, signed=False)
+    return compute_points(zip(xyz[::3], xyz[1::3], xyz[2::3]))
+
+
 INPUT_S = '''\
 2,2,2
 1,2,2
@@ -57,7 +69,7 @@ INPUT_S = '''\
 EXPECTED = 64
 
 
-@pytest.mark.parametrize(
+@support.parametrize(
     ('input_s', 'expected'),
     (
         (INPUT_S, EXPECTED),
@@ -73,7 +85,7 @@ def main() -> int:
     args = parser.parse_args()
 
     with open(args.data_file) as f, support.timing():
-        print(compute(f.read()))
+        print(compute_stream(support.iter_lines(f)))
 
     return 0
 
@@ -4,8 +4,7 @@ import argparse
 import os.path
 import sys
 from typing import Generator
-
-import pytest
+from typing import Iterable
 
 import support
 
@@ -38,7 +37,12 @@ def surface_area(pts: set[tuple[int, int, int]]) -> int:
     return count
 
 
-def compute(s: str) -> int:
+def parse_line(line: str) -> tuple[int, int, int]:
+    x, y, z = line.split(',')
+    return int(x), int(y), int(z)
+
+
+def compute_points(points: Iterable[tuple[int, int, int]]) -> int:
     count = 0
     coords = set()
 
@@ -49,8 +53,7 @@ def compute(s: str) -> int:
     min_z = sys.maxsize
     max_z = -sys.maxsize
 
-    for line in s.splitlines():
-        x, y, z = map(int, line.split(','))
+    for x, y, z in points:
         count += 6
         for cx, cy, cz in adjacent_faces(x, y, z):
             if (cx, cy, cz) in coords:
@@ -87,6 +90,15 @@ def compute(s: str) -> int:
     return count - surface_area(remaining)
 
 
+def compute_stream(lines: Iterable[str]) -> int:
+    return compute_points(map(parse_line, lines))
+
+
+def compute(s: str) -> int:
+    xyz = support.parse_points_array(s.encode(), 3, signed=False)
+    return compute_points(zip(xyz[::3], xyz[1::3], xyz[2::3]))
+
+
 INPUT_S = '''\
 2,2,2
 1,2,2
@@ -105,7 +117,7 @@ INPUT_S = '''\
 EXPECTED = 58
 
 
-@pytest.mark.parametrize(
+@support.parametrize(
     ('input_s', 'expected'),
     (
         (INPUT_S, EXPECTED),
@@ -121,7 +133,7 @@ def main() -> int:
     args = parser.parse_args()
 
     with open(args.data_file) as f, support.timing():
-        print(compute(f.read()))
+        print(compute_stream(support.iter_lines(f)))
 
     return 0
 
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import random
+from typing import Generator
+
+import support
+
+
+def generate(size: int, rand: random.Random) -> Generator[str, None, None]:
+    n = 0
+    blueprint_id = 1
+    while n < size:
+        line = (
+            f'Blueprint {blueprint_id}: '
+            f'Each ore robot costs {rand.randint(2, 4)} ore. '
+            f'Each clay robot costs {rand.randint(2, 4)} ore. '
+            f'Each obsidian robot costs {rand.randint(2, 4)} ore '
+            f'and {rand.randint(5, 20)} clay. '
+            f'Each geode robot costs {rand.randint(2, 4)} ore '
+            f'and {rand.randint(5, 20)} obsidian.\n'
+        )
+        yield line
+        n += len(line)
+        blueprint_id += 1
+
+
+def test() -> None:
+    from day19 import part1
+
+    s = support.generate_input(generate, 512)
+    blueprints = part1.parse_blueprints(s)
+    assert len(blueprints) == len(s.splitlines())
+    for i, blueprint in enumerate(blueprints, 1):
+        assert blueprint.id == i
+        assert 5 <= blueprint.obs_bot_cla <= 20
+        assert 5 <= blueprint.geo_bot_obs <= 20
+        assert all(
+            2 <= ore <= 4
+            for ore in (
+                blueprint.ore_bot_ore,
+                blueprint.cla_bot_ore,
+                blueprint.obs_bot_ore,
+                blueprint.geo_bot_ore,
+            )
+        )
+
+
+if __name__ == '__main__':
+    raise SystemExit(support.generator_main(generate))
@@ -1,13 +1,9 @@
 from __future__ import annotations
 
 import argparse
-import collections
 import os.path
-import re
 from typing import NamedTuple
 
-import pytest
-
 import support
 
 INPUT_TXT = os.path.join(os.path.dirname(__file__), 'input.txt')
@@ -26,12 +22,11 @@ class Blueprint(NamedTuple):
 
 
 def parse_blueprints(s: str) -> list[Blueprint]:
-    blueprints = []
-    for line in s.splitlines():
-        numbers = re.findall(r'\d+', line)
-        blueprints.append(Blueprint(*[int(x) for x in numbers]))
+    records = support.parse_int_records(s.encode(), 7, signed=False)
+    return [Blueprint._make(record) for record in records.records()]
+
 
-    return blueprints
+State = tuple[int, int, int, int, int, int, int, int, int]
 
 
 def compute_blueprint(blueprint: Blueprint, time_minutes: int) -> int:
@@ -42,101 +37,113 @@ def compute_blueprint(blueprint: Blueprint, time_minutes: int) -> int:
         blueprint.geo_bot_ore,
     )
 
-    seen = set()
-    best_at: dict[int, int] = {}
-    todo = collections.deque([(0, 1, 0, 0, 0, 0, 0, 0, 0)])
-    while todo:
-        m, ore_b, cla_b, obs_b, geo_b, ore, cla, obs, geo = todo.popleft()
-
-        ore = min(max_ore * (time_minutes - m), ore)
-        cla = min(blueprint.obs_bot_cla * (time_minutes - m), cla)
-        obs = min(blueprint.geo_bot_obs * (time_minutes - m), obs)
-        ore_b = min(ore_b, max_ore)
-        cla_b = min(cla_b, blueprint.obs_bot_cla)
-        obs_b = min(obs_b, blueprint.geo_bot_obs)
-
-        tup = (m, ore_b, cla_b, obs_b, geo_b, ore, cla, obs, geo)
-        if tup in seen:
-            continue
-        else:
-            seen.add(tup)
-
-        best_at[m] = max(best_at.get(m, 0), geo)
-
+    def normalized(
+            m: int,
+            ore_b: int, cla_b: int, obs_b: int, geo_b: int,
+            ore: int, cla: int, obs: int, geo: int,
+    ) -> State:
+        # more than can ever be spent is as good as just enough
+        return (
+            m,
+            min(ore_b, max_ore),
+            min(cla_b, blueprint.obs_bot_cla),
+            min(obs_b, blueprint.geo_bot_obs),
+            geo_b,
+            min(max_ore * (time_minutes - m), ore),
+            min(blueprint.obs_bot_cla * (time_minutes - m), cla),
+            min(blueprint.geo_bot_obs * (time_minutes - m), obs),
+            geo,
+        )
+
+    def neighbors(state: State) -> list[State]:
+        m, ore_b, cla_b, obs_b, geo_b, ore, cla, obs, geo = state
         if m == time_minutes:
-            continue
+            return []
 
         # always buy geode if possible
         if ore >= blueprint.geo_bot_ore and obs >= blueprint.geo_bot_obs:
-            todo.append((
-                m + 1,
-                ore_b,
-                cla_b,
-                obs_b,
-                geo_b + 1,
-                ore + ore_b - blueprint.geo_bot_ore,
-                cla + cla_b,
-                obs + obs_b - blueprint.geo_bot_obs,
-                geo + geo_b,
-            ))
-            continue
+            return [
+                normalized(
+                    m + 1,
+                    ore_b,
+                    cla_b,
+                    obs_b,
+                    geo_b + 1,
+                    ore + ore_b - blueprint.geo_bot_ore,
+                    cla + cla_b,
+                    obs + obs_b - blueprint.geo_bot_obs,
+                    geo + geo_b,
+                ),
+            ]
+
+        ret = []
 
         # can buy obsidian?
         if ore >= blueprint.obs_bot_ore and cla >= blueprint.obs_bot_cla:
-            todo.append((
-                m + 1,
-                ore_b,
-                cla_b,
-                obs_b + 1,
-                geo_b,
-                ore + ore_b - blueprint.obs_bot_ore,
-                cla + cla_b - blueprint.obs_bot_cla,
-                obs + obs_b,
-                geo + geo_b,
-            ))
+            ret.append(
+                normalized(
+                    m + 1,
+                    ore_b,
+                    cla_b,
+                    obs_b + 1,
+                    geo_b,
+                    ore + ore_b - blueprint.obs_bot_ore,
+                    cla + cla_b - blueprint.obs_bot_cla,
+                    obs + obs_b,
+                    geo + geo_b,
+                ),
+            )
 
         # can buy clay?
         if ore >= blueprint.cla_bot_ore:
-            todo.append((
-                m + 1,
-                ore_b,
-                cla_b + 1,
-                obs_b,
-                geo_b,
-                ore + ore_b - blueprint.cla_bot_ore,
-                cla + cla_b,
-                obs + obs_b,
-                geo + geo_b,
-            ))
+            ret.append(
+                normalized(
+                    m + 1,
+                    ore_b,
+                    cla_b + 1,
+                    obs_b,
+                    geo_b,
+                    ore + ore_b - blueprint.cla_bot_ore,
+                    cla + cla_b,
+                    obs + obs_b,
+                    geo + geo_b,
+                ),
+            )
 
         # can buy ore?
         if ore >= blueprint.ore_bot_ore:
-            todo.append((
+            ret.append(
+                normalized(
+                    m + 1,
+                    ore_b + 1,
+                    cla_b,
+                    obs_b,
+                    geo_b,
+                    ore + ore_b - blueprint.ore_bot_ore,
+                    cla + cla_b,
+                    obs + obs_b,
+                    geo + geo_b,
+                ),
+            )
+
+        # buy nothing
+        ret.append(
+            normalized(
                 m + 1,
-                ore_b + 1,
+                ore_b,
                 cla_b,
                 obs_b,
                 geo_b,
-                ore + ore_b - blueprint.ore_bot_ore,
+                ore + ore_b,
                 cla + cla_b,
                 obs + obs_b,
                 geo + geo_b,
-            ))
-
-        # buy nothing
-        todo.append((
-            m + 1,
-            ore_b,
-            cla_b,
-            obs_b,
-            geo_b,
-            ore + ore_b,
-            cla + cla_b,
-            obs + obs_b,
-            geo + geo_b,
-        ))
+            ),
+        )
+        return ret
 
-    return best_at[time_minutes]
+    seen = support.bfs(((0, 1, 0, 0, 0, 0, 0, 0, 0),), neighbors)
+    return max(state[-1] for state in seen if state[0] == time_minutes)
 
 
 def compute(s: str) -> int:
@@ -150,7 +157,7 @@ Blueprint 2: Each ore robot costs 2 ore. Each clay robot costs 3 ore. Each obsid
 EXPECTED = 33
 
 
-@pytest.mark.parametrize(
+@support.parametrize(
     ('input_s', 'expected'),
     (
         (INPUT_S, EXPECTED),
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import random
+from typing import Generator
+
+import support
+
+
+def generate(size: int, rand: random.Random) -> Generator[str, None, None]:
+    count = max(2, size // 6)
+    zero = rand.randrange(count)
+    for i in range(count):
+        if i == zero:
+            yield '0\n'
+        else:
+            yield f'{rand.choice((-1, 1)) * rand.randint(1, 9999)}\n'
+
+
+def test() -> None:
+    from day20 import part1
+    from day20 import part2
+
+    s = support.generate_input(generate, 1024)
+    numbers = [int(line) for line in s.splitlines()]
+    assert len(numbers) == 1024 // 6
+    assert numbers.count(0) == 1
+    assert all(1 <= abs(n) <= 9999 for n in numbers if n)
+    assert part1.compute(s) == -3417
+    assert part2.compute(s) == -2640911103862
+
+
+if __name__ == '__main__':
+    raise SystemExit(support.generator_main(generate))
@@ -5,15 +5,13 @@ import collections
 import os.path
 from unittest import mock
 
-import pytest
-
 import support
 
 INPUT_TXT = os.path.join(os.path.dirname(__file__), 'input.txt')
 
 
 def compute(s: str) -> int:
-    orig_numbers = support.parse_numbers_split(s)
+    orig_numbers = support.parse_numbers_array(s.encode())
     numbers = collections.deque(list(enumerate(orig_numbers)))
 
     for i, num in enumerate(orig_numbers):
@@ -42,7 +40,7 @@ INPUT_S = '''\
 EXPECTED = 3
 
 
-@pytest.mark.parametrize(
+@support.parametrize(
     ('input_s', 'expected'),
     (
         (INPUT_S, EXPECTED),
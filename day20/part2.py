@@ -5,16 +5,15 @@ import collections
 import os.path
 from unittest import mock
 
-import pytest
-
 import support
 
 INPUT_TXT = os.path.join(os.path.dirname(__file__), 'input.txt')
 
 
 def compute(s: str) -> int:
-    orig_numbers = support.parse_numbers_split(s)
-    orig_numbers = [n * 811589153 for n in orig_numbers]
+    orig_numbers = [
+        n * 811589153 for n in support.parse_numbers_array(s.encode())
+    ]
     numbers = collections.deque(list(enumerate(orig_numbers)))
 
     for _ in range(10):
@@ -44,7 +43,7 @@ INPUT_S = '''\
 EXPECTED = 1623178306
 
 
-@pytest.mark.parametrize(
+@support.parametrize(
     ('input_s', 'expected'),
     (
         (INPUT_S, EXPECTED),
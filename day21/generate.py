@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import math
+import random
+import string
+from typing import Generator
+
+import support
+
+
+def _split(rand: random.Random, value: int) -> tuple[int, str, int]:
+    """pick `lhs op rhs == value` with every operand positive and exact"""
+    ops = ['-', '/']
+    if value >= 2:
+        ops.append('+')
+    factors = [n for n in range(2, 10) if value % n == 0]
+    if factors:
+        ops.append('*')
+
+    op = rand.choice(ops)
+    if op == '+':
+        lhs = rand.randint(1, value - 1)
+        return lhs, op, value - lhs
+    elif op == '-':
+        rhs = rand.randint(1, 20)
+        return value + rhs, op, rhs
+    elif op == '*':
+        rhs = rand.choice(factors)
+        return value // rhs, op, rhs
+    else:
+        rhs = rand.randint(2, 5)
+        return value * rhs, op, rhs
+
+
+def generate(size: int, rand: random.Random) -> Generator[str, None, None]:
+    leaves = max(4, size // 30)
+    width = max(4, math.ceil(math.log(leaves * 2, 26)))
+    seen = {'root', 'humn'}
+
+    def _name() -> str:
+        name = 'root'
+        while name in seen:
+            name = ''.join(rand.choices(string.ascii_lowercase, k=width))
+        seen.add(name)
+        return name
+
+    # both sides of `root` are equal so the original `humn` is the answer
+    # to part 2, which keeps every inverted operation exact
+    value = rand.randint(100, 1000)
+    lhs, rhs = _name(), _name()
+    yield f'root: {lhs} + {rhs}\n'
+
+    todo = [
+        (lhs, value, leaves // 2, True),
+        (rhs, value, leaves - leaves // 2, False),
+    ]
+    while todo:
+        name, value, count, has_humn = todo.pop()
+        if count == 1:
+            yield f'{name}: {value}\n'
+            continue
+
+        lhs_value, op, rhs_value = _split(rand, value)
+        lhs_count = rand.randint(1, count - 1)
+        lhs_humn = has_humn and rand.random() < lhs_count / count
+        rhs_humn = has_humn and not lhs_humn
+        lhs = 'humn' if lhs_humn and lhs_count == 1 else _name()
+        rhs = 'humn' if rhs_humn and count - lhs_count == 1 else _name()
+        yield f'{name}: {lhs} {op} {rhs}\n'
+        todo.append((lhs, lhs_value, lhs_count, lhs_humn))
+        todo.append((rhs, rhs_value, count - lhs_count, rhs_humn))
+
+
+def test() -> None:
+    from day21 import part1
+    from day21 import part2
+
+    s = support.generate_input(generate, 1024)
+    names = [line.split(':')[0] for line in s.splitlines()]
+    assert len(set(names)) == len(names)
+    assert {'root', 'humn'} <= set(names)
+    humn, = (line for line in s.splitlines() if line.startswith('humn:'))
+    assert part1.compute(s) == 1928
+    assert part2.compute(s) == int(humn.split()[1])
+
+
+if __name__ == '__main__':
+    raise SystemExit(support.generator_main(generate))
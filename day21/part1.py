@@ -5,8 +5,7 @@ import functools
 import operator
 import os.path
 from typing import Callable
-
-import pytest
+from typing import Iterable
 
 import support
 
@@ -20,10 +19,10 @@ OPS = {
 }
 
 
-def compute(s: str) -> int:
+def compute_stream(lines: Iterable[str]) -> int:
     ops: dict[str, int | tuple[Callable[[int, int], int], str, str]] = {}
 
-    for line in s.splitlines():
+    for line in lines:
         if len(line.split()) == 4:
             name, rest = line.split(': ')
             op1, op, op2 = rest.split()
@@ -44,6 +43,10 @@ def compute(s: str) -> int:
     return _value('root')
 
 
+def compute(s: str) -> int:
+    return compute_stream(s.splitlines())
+
+
 INPUT_S = '''\
 root: pppw + sjmn
 dbpl: 5
@@ -64,7 +67,7 @@ hmdt: 32
 EXPECTED = 152
 
 
-@pytest.mark.parametrize(
+@support.parametrize(
     ('input_s', 'expected'),
     (
         (INPUT_S, EXPECTED),
@@ -80,7 +83,7 @@ def main() -> int:
     args = parser.parse_args()
 
     with open(args.data_file) as f, support.timing():
-        print(compute(f.read()))
+        print(compute_stream(support.iter_lines(f)))
 
     return 0
 
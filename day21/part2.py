@@ -5,8 +5,7 @@ import contextlib
 import functools
 import operator
 import os.path
-
-import pytest
+from typing import Iterable
 
 import support
 
@@ -24,11 +23,11 @@ OPS2 = {
 }
 
 
-def compute(s: str) -> int:
+def compute_stream(lines: Iterable[str]) -> int:
     ops: dict[str, int | tuple[str, str, str]] = {}
 
     root_left = root_right = None
-    for line in s.splitlines():
+    for line in lines:
         if line.startswith('humn:'):
             continue
         elif line.startswith('root:'):
@@ -94,6 +93,10 @@ def compute(s: str) -> int:
     return right_val
 
 
+def compute(s: str) -> int:
+    return compute_stream(s.splitlines())
+
+
 INPUT_S = '''\
 root: pppw + sjmn
 dbpl: 5
@@ -114,7 +117,7 @@ hmdt: 32
 EXPECTED = 301
 
 
-@pytest.mark.parametrize(
+@support.parametrize(
     ('input_s', 'expected'),
     (
         (INPUT_S, EXPECTED),
@@ -130,7 +133,7 @@ def main() -> int:
     args = parser.parse_args()
 
     with open(args.data_file) as f, support.timing():
-        print(compute(f.read()))
+        print(compute_stream(support.iter_lines(f)))
 
     return 0
 
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import random
+from typing import Generator
+
+import support
+
+# the same cube net as the real inputs
+NET = (' ##', ' #', '##', '#')
+
+
+def _tiles(rand: random.Random, n: int) -> str:
+    return ''.join('#' if rand.random() < .1 else '.' for _ in range(n))
+
+
+def generate(size: int, rand: random.Random) -> Generator[str, None, None]:
+    # half of the bytes go to the map (~8 face_size ** 2), half to the path
+    face_size = max(4, int((size / 2 / 8) ** .5))
+
+    for row, net_row in enumerate(NET):
+        for y in range(face_size):
+            line = ''.join(
+                ' ' * face_size if c == ' ' else _tiles(rand, face_size)
+                for c in net_row
+            )
+            if row == y == 0:  # the path starts on the first tile
+                line = f'{" " * face_size}.{line[face_size + 1:]}'
+            yield f'{line}\n'
+    yield '\n'
+
+    n = 0
+    while n < size // 2:
+        chunk = f'{rand.randint(1, face_size * 2)}{rand.choice("LR")}'
+        yield chunk
+        n += len(chunk)
+    yield f'{rand.randint(1, face_size * 2)}\n'
+
+
+def test() -> None:
+    from day22 import part1
+    from day22 import part2
+
+    s = support.generate_input(generate, 1024)
+    board, _ = s.split('\n\n')
+    rows = board.splitlines()
+    face_size = len(rows) // len(NET)
+    assert len(rows) == face_size * len(NET)
+    for i, row in enumerate(rows):
+        faces = [
+            row[j:j + face_size].strip() != ''
+            for j in range(0, len(row), face_size)
+        ]
+        assert faces == [c == '#' for c in NET[i // face_size]]
+    assert rows[0][face_size] == '.'
+    assert part1.compute(s) == 29032
+    assert part2.compute(s) == 24008
+
+
+if __name__ == '__main__':
+    raise SystemExit(support.generator_main(generate))
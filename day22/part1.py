@@ -4,8 +4,6 @@ import argparse
 import os.path
 import re
 
-import pytest
-
 import support
 
 INPUT_TXT = os.path.join(os.path.dirname(__file__), 'input.txt')
@@ -84,7 +82,7 @@ INPUT_S = '''\
 EXPECTED = 6032
 
 
-@pytest.mark.parametrize(
+@support.parametrize(
     ('input_s', 'expected'),
     (
         (INPUT_S, EXPECTED),
@@ -6,8 +6,6 @@ import enum
 import os.path
 from unittest import mock
 
-import pytest
-
 import support
 
 INPUT_TXT = os.path.join(os.path.dirname(__file__), 'input.txt')
@@ -180,7 +178,7 @@ INPUT_S = '''\
 EXPECTED = 5031
 
 
-@pytest.mark.parametrize(
+@support.parametrize(
     ('input_s', 'expected'),
     (
             (INPUT_S, EXPECTED),
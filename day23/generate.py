@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import random
+from typing import Generator
+
+import support
+
+
+def generate(size: int, rand: random.Random) -> Generator[str, None, None]:
+    width = max(2, int(size ** .5))
+    for _ in range(width):
+        tiles = ''.join(rand.choices('#.', weights=(2, 3), k=width - 1))
+        yield f'{tiles}\n'
+
+
+def test() -> None:
+    from day23 import part1
+    from day23 import part2
+
+    s = support.generate_input(generate, 1024)
+    lines = s.splitlines()
+    assert len(lines) == 32
+    assert {len(line) for line in lines} == {31}
+    assert set(s) == {'#', '.', '\n'}
+    assert part1.compute(s) == 1126
+    assert part2.compute(s) == 239
+
+
+if __name__ == '__main__':
+    raise SystemExit(support.generator_main(generate))
@@ -4,49 +4,60 @@ import argparse
 import collections
 import os.path
 
-import pytest
-
 import support
 
 INPUT_TXT = os.path.join(os.path.dirname(__file__), 'input.txt')
 
+# bit k of a neighbour mask is the k-th neighbour from `support.adjacent_8`
+NEIGHBOR_BITS = {pt: 1 << k for k, pt in enumerate(support.adjacent_8(0, 0))}
+
 
 def compute(s: str) -> int:
     coords = support.parse_coords_hash(s)
-
-    choices = collections.deque([
-        (support.Direction4.UP, ((-1, -1), (0, -1), (1, -1))),
-        (support.Direction4.DOWN, ((-1, 1), (0, 1), (1, 1))),
-        (support.Direction4.LEFT, ((-1, 1), (-1, 0), (-1, -1))),
-        (support.Direction4.RIGHT, ((1, 1), (1, 0), (1, -1))),
-    ])
+    # elves spread at most one cell per round so they never reach the border
+    grid = support.Grid2D.from_coords(coords, margin=11)
+    cells, width = grid.cells, grid.width
+    elves = {grid.index(x, y) for x, y in coords}
+
+    choices = collections.deque(
+        (cand_dir, sum(NEIGHBOR_BITS[pt] for pt in cand_points))
+        for cand_dir, cand_points in (
+            (support.Direction4.UP, ((-1, -1), (0, -1), (1, -1))),
+            (support.Direction4.DOWN, ((-1, 1), (0, 1), (1, 1))),
+            (support.Direction4.LEFT, ((-1, 1), (-1, 0), (-1, -1))),
+            (support.Direction4.RIGHT, ((1, 1), (1, 0), (1, -1))),
+        )
+    )
 
     for _ in range(10):
-        moves: dict[tuple[int, int], list[tuple[int, int]]]
-        moves = collections.defaultdict(list)
-
-        for x, y in coords:
-            if all(
-                    (cx, cy) not in coords
-                    for cx, cy in support.adjacent_8(x, y)
-            ):
+        moves: dict[int, list[int]] = collections.defaultdict(list)
+
+        offsets = [
+            (cand_dir.x + cand_dir.y * width, cand_bits)
+            for cand_dir, cand_bits in choices
+        ]
+        masks = grid.neighbor_masks_8()
+
+        for elf in elves:
+            mask = masks[elf]
+            if not mask:
                 continue
 
-            for cand_dir, cand_points in choices:
-                if all(
-                        (x + dx, y + dy) not in coords
-                        for dx, dy in cand_points
-                ):
-                    moves[cand_dir.apply(x, y)].append((x, y))
+            for move, cand_bits in offsets:
+                if not mask & cand_bits:
+                    moves[elf + move].append(elf)
                     break
 
         moved = {k: v[0] for k, v in moves.items() if len(v) == 1}
-        coords = (coords - set(moved.values())) | moved.keys()
+        for dst, src in moved.items():
+            cells[src] = 0
+            cells[dst] = 1
+        elves = (elves - set(moved.values())) | moved.keys()
 
         choices.rotate(-1)
 
-    bx, by = support.bounds(coords)
-    return (bx.max - bx.min + 1) * (by.max - by.min + 1) - len(coords)
+    bx, by = support.bounds(grid.coords(i) for i in elves)
+    return (bx.max - bx.min + 1) * (by.max - by.min + 1) - len(elves)
 
 
 INPUT_S = '''\
@@ -61,7 +72,7 @@ INPUT_S = '''\
 EXPECTED = 110
 
 
-@pytest.mark.parametrize(
+@support.parametrize(
     ('input_s', 'expected'),
     (
         (INPUT_S, EXPECTED),
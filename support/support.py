@@ -1,37 +1,785 @@
 from __future__ import annotations
 
 import argparse
+import array
+import collections
 import contextlib
 import enum
+import functools
+import importlib
+import math
+import mmap
 import os.path
 import re
 import sys
 import time
-import urllib.error
-import urllib.parse
-import urllib.request
+from typing import Any
+from typing import Callable
+from typing import Container
 from typing import Generator
+from typing import Hashable
+from typing import IO
 from typing import Iterable
+from typing import Iterator
 from typing import NamedTuple
+from typing import Sequence
+from typing import TypeAlias
+from typing import TYPE_CHECKING
+from typing import TypeVar
+
+if TYPE_CHECKING:
+    import random
+    import sqlite3
+    from types import FrameType
+
+# the heavier stdlib modules are imported where they are used so solvers,
+# which only need the parsing helpers, start quickly
 
 HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+BENCH_DB = os.path.join(ROOT, 'bench.db')
+
+T = TypeVar('T')
+R = TypeVar('R')
+H = TypeVar('H', bound=Hashable)
+F = TypeVar('F', bound=Callable[..., Any])
+
+
+def parametrize(
+        argnames: str | Sequence[str],
+        argvalues: Iterable[Any],
+) -> Callable[[F], F]:
+    """`pytest.mark.parametrize`, without importing pytest as a script"""
+    if 'pytest' in sys.modules:
+        import pytest
+
+        return pytest.mark.parametrize(argnames, argvalues)
+    else:
+        return lambda func: func
+
+
+counters: collections.Counter[str] = collections.Counter()
+
+
+def _count_disabled(name: str, n: int = 1) -> None:
+    pass
+
+
+def _count_enabled(name: str, n: int = 1) -> None:
+    counters[name] += n
+
+
+# `support.count('heap pushes')` adds to `support.counters` once enabled
+# (`enable_counters()` or $AOC_COUNTERS=1) and is a no-op otherwise.  always
+# call it through the module so enabling takes effect
+count = _count_disabled
+
+
+def enable_counters(enabled: bool = True) -> None:
+    global count
+    count = _count_enabled if enabled else _count_disabled
+
+
+def format_counters(counts: dict[str, int]) -> str:
+    return ', '.join(f'{k}: {v:,}' for k, v in sorted(counts.items()))
+
+
+if os.environ.get('AOC_COUNTERS') == '1':
+    enable_counters()
 
 
 @contextlib.contextmanager
-def timing(name: str = '') -> Generator[None, None, None]:
-    before = time.time()
+def timing(
+        name: str = '',
+        *,
+        memory: bool | None = None,
+        sink: IO[str] | None = None,
+) -> Generator[None, None, None]:
+    """
+    Times the block, printing a summary to stderr.
+
+    A JSON record is also written to `sink` (or appended to the file named
+    by $AOC_TIMING_SINK) so timings can be aggregated.  `memory` (or
+    $AOC_TIMING_MEMORY=1) additionally traces peak allocations.
+    """
+    if memory is None:
+        memory = os.environ.get('AOC_TIMING_MEMORY') == '1'
+    if memory:
+        import tracemalloc
+
+        # inside a traced caller (`aoc-run --profile tracemalloc`, a nested
+        # `timing`) leave its tracing on, the peak is then the caller's
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+
+    cpu_before = time.process_time_ns()
+    before = time.perf_counter_ns()
     try:
         yield
     finally:
-        after = time.time()
-        t = (after - before) * 1000
-        unit = 'ms'
-        if t < 100:
-            t *= 1000
-            unit = 'μs'
+        wall_ns = time.perf_counter_ns() - before
+        cpu_ns = time.process_time_ns() - cpu_before
+        record: dict[str, object] = {
+            'name': name,
+            'script': _script_name(),
+            'wall_ns': wall_ns,
+            'cpu_ns': cpu_ns,
+            'timestamp': time.time(),
+        }
+        msg = f'> {format_ns(wall_ns)} (cpu {format_ns(cpu_ns)})'
+        if memory:
+            _, peak = tracemalloc.get_traced_memory()
+            if started_tracing:
+                tracemalloc.stop()
+            record['peak_alloc'] = peak
+            record['max_rss'] = _max_rss()
+            msg += f' (peak {peak / 1024:.1f} KiB)'
         if name:
-            name = f' ({name})'
-        print(f'> {int(t)} {unit}{name}', file=sys.stderr, flush=True)
+            msg += f' ({name})'
+        if counters:
+            record['counters'] = dict(counters)
+            msg += f'\n> {format_counters(counters)}'
+        print(msg, file=sys.stderr, flush=True)
+
+        import json
+
+        if sink is not None:
+            sink.write(f'{json.dumps(record)}\n')
+        elif os.environ.get('AOC_TIMING_SINK'):
+            with open(os.environ['AOC_TIMING_SINK'], 'a') as f:
+                f.write(f'{json.dumps(record)}\n')
+
+
+def _script_name() -> str:
+    script = os.path.abspath(sys.argv[0])
+    if script.startswith(f'{ROOT}{os.sep}'):
+        return os.path.relpath(script, ROOT)
+    else:
+        return os.path.basename(script)
+
+
+def _max_rss() -> int:
+    import resource
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # linux reports KiB, macos reports bytes
+    return max_rss if sys.platform == 'darwin' else max_rss * 1024
+
+
+class Stats(NamedTuple):
+    min: int
+    median: int
+    p95: int
+
+
+def summarize(samples: Sequence[int]) -> Stats:
+    import statistics
+
+    ordered = sorted(samples)
+    p95 = ordered[min(len(ordered) - 1, -(-len(ordered) * 95 // 100) - 1)]
+    return Stats(ordered[0], int(statistics.median(ordered)), p95)
+
+
+def format_ns(ns: float) -> str:
+    for unit, scale in (('s', 10 ** 9), ('ms', 10 ** 6), ('μs', 10 ** 3)):
+        if ns >= scale:
+            return f'{ns / scale:.3g} {unit}'
+    return f'{ns:.3g} ns'
+
+
+def get_solvers(days: Iterable[int] = ()) -> list[tuple[int, int]]:
+    import glob
+
+    days = frozenset(days)
+    solvers = []
+    for day_dir in sorted(glob.glob(os.path.join(ROOT, 'day[0-9][0-9]'))):
+        day = int(os.path.basename(day_dir)[len('day'):])
+        if day == 0 or (days and day not in days):
+            continue
+        for part in (1, 2):
+            if os.path.exists(os.path.join(day_dir, f'part{part}.py')):
+                solvers.append((day, part))
+    return solvers
+
+
+def import_day(day: int, name: str) -> Any:
+    if ROOT not in sys.path:
+        sys.path.insert(0, ROOT)
+    return importlib.import_module(f'day{day:02}.{name}')
+
+
+def load_compute(day: int, part: int) -> Callable[[str], object]:
+    return import_day(day, f'part{part}').compute
+
+
+def read_input(day: int) -> str:
+    with open(os.path.join(ROOT, f'day{day:02}', 'input.txt')) as f:
+        return f.read()
+
+
+def measure(
+        compute: Callable[[T], object],
+        s: T,
+        *,
+        repeat: int,
+        warmup: int,
+) -> Stats:
+    for _ in range(warmup):
+        compute(s)
+
+    samples = []
+    for _ in range(repeat):
+        before = time.perf_counter_ns()
+        compute(s)
+        samples.append(time.perf_counter_ns() - before)
+    return summarize(samples)
+
+
+def benchmark() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('days', type=int, nargs='*')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--warmup', type=int, default=1)
+    parser.add_argument(
+        '--save', action='store_true',
+        help='record results for the current commit in --db',
+    )
+    parser.add_argument('--db', default=BENCH_DB)
+    args = parser.parse_args()
+
+    results: dict[tuple[int, int], Stats] = {}
+
+    def _measure(day: int, part: int) -> Stats:
+        if (day, part) not in results:
+            results[(day, part)] = measure(
+                load_compute(day, part), read_input(day),
+                repeat=args.repeat, warmup=args.warmup,
+            )
+        return results[(day, part)]
+
+    print(f'{"day":>5} {"min":>10} {"median":>10} {"p95":>10} {"norm":>8}')
+    # normalize to day 1 part 1 so numbers compare across machines
+    baseline = _measure(1, 1).median
+    for day, part in get_solvers(args.days):
+        stats = _measure(day, part)
+        print(
+            f'{day:>2}.{part:<2} '
+            f'{format_ns(stats.min):>10} '
+            f'{format_ns(stats.median):>10} '
+            f'{format_ns(stats.p95):>10} '
+            f'{stats.median / baseline:>8.2f}',
+            flush=True,
+        )
+
+    if args.save:
+        commit = git_commit()
+        with contextlib.closing(open_bench_db(args.db)) as db, db:
+            for (day, part), stats in results.items():
+                save_result(
+                    db, commit, day, part, input_hash(read_input(day)),
+                    stats,
+                )
+        print(f'saved {len(results)} results for {commit}')
+
+    return 0
+
+
+def past_timings(db: sqlite3.Connection) -> dict[tuple[int, int], int]:
+    """most recently saved median for each solver"""
+    query = (
+        'SELECT day, part, median_ns FROM results ORDER BY timestamp, rowid'
+    )
+    return {(day, part): t for day, part, t in db.execute(query)}
+
+
+PROFILERS = ('cprofile', 'tracemalloc', 'sample')
+
+
+def _frame_label(frame: FrameType) -> str:
+    code = frame.f_code
+    filename = code.co_filename
+    if filename.startswith(f'{ROOT}{os.sep}'):
+        filename = os.path.relpath(filename, ROOT)
+    if frame.f_lineno is None:
+        return f'{code.co_name} ({filename})'
+    else:
+        return f'{code.co_name} ({filename}:{frame.f_lineno})'
+
+
+def _while_running(
+        func: Callable[[T], R],
+        arg: T,
+        interval: float,
+        poll: Callable[[list[FrameType]], None],
+) -> R:
+    """
+    Runs `func(arg)`, calling `poll` from another thread every `interval`.
+
+    `poll` gets the frames below `func` (outermost first).
+    """
+    import threading
+
+    def _target() -> R:
+        return func(arg)
+
+    done = threading.Event()
+    ident = threading.get_ident()
+
+    def _poller() -> None:
+        while not done.wait(interval):
+            frame: FrameType | None = sys._current_frames().get(ident)
+            stack = []
+            while frame is not None and frame.f_code is not _target.__code__:
+                stack.append(frame)
+                frame = frame.f_back
+            if frame is not None:
+                poll(stack[::-1])
+
+    thread = threading.Thread(target=_poller, daemon=True)
+    thread.start()
+    try:
+        return _target()
+    finally:
+        done.set()
+        thread.join()
+
+
+def profile_compute(
+        compute: Callable[[T], object],
+        s: T,
+        kind: str,
+        prefix: str,
+        *,
+        interval: float = .005,
+) -> object:
+    """
+    Runs `compute(s)` under a profiler, writing its report next to `prefix`.
+
+    - `cprofile`: `{prefix}.pstats`, readable with `python -m pstats`
+    - `tracemalloc`: `{prefix}.tracemalloc.txt`, the top allocating lines
+      from a snapshot taken close to peak memory
+    - `sample`: `{prefix}.collapsed`, the stack every `interval` seconds,
+      for flamegraph.pl / speedscope
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(prefix)), exist_ok=True)
+    if kind == 'cprofile':
+        import cProfile
+
+        profile = cProfile.Profile()
+        answer = profile.runcall(compute, s)
+        profile.dump_stats(f'{prefix}.pstats')
+    elif kind == 'tracemalloc':
+        import tracemalloc
+
+        snapshots: list[tracemalloc.Snapshot] = []
+        snapshot_size = 0
+
+        def _poll_memory(stack: list[FrameType]) -> None:
+            nonlocal snapshot_size
+            size, _ = tracemalloc.get_traced_memory()
+            # snapshots are slow: only take one once memory grew by 10%
+            if size > snapshot_size * 1.1:
+                snapshots[:] = [tracemalloc.take_snapshot()]
+                snapshot_size = size
+
+        tracemalloc.start()
+        try:
+            answer = _while_running(compute, s, interval, _poll_memory)
+            _, peak = tracemalloc.get_traced_memory()
+            if not snapshots:
+                snapshots.append(tracemalloc.take_snapshot())
+        finally:
+            tracemalloc.stop()
+
+        snapshot, = snapshots
+        snapshot = snapshot.filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, '<frozen *>'),
+        ))
+        with open(f'{prefix}.tracemalloc.txt', 'w') as f:
+            f.write(f'peak {peak / 1024:.1f} KiB, snapshot at ')
+            f.write(f'{snapshot_size / 1024:.1f} KiB\n')
+            for stat in snapshot.statistics('lineno')[:25]:
+                f.write(f'{stat}\n')
+    elif kind == 'sample':
+        counts: collections.Counter[str] = collections.Counter()
+
+        def _poll_stack(stack: list[FrameType]) -> None:
+            counts[';'.join(_frame_label(frame) for frame in stack)] += 1
+
+        answer = _while_running(compute, s, interval, _poll_stack)
+        with open(f'{prefix}.collapsed', 'w') as f:
+            for stack_s, n in sorted(counts.items()):
+                f.write(f'{stack_s} {n}\n')
+    else:
+        raise ValueError(f'unknown profiler: {kind}')
+    return answer
+
+
+def _run_solver(
+        day: int,
+        part: int,
+        cache: bool = False,
+        profile: str | None = None,
+        profile_dir: str = '',
+) -> tuple[object, int, dict[str, int]]:
+    compute = load_compute(day, part)
+    s = read_input(day)
+    counters.clear()
+    before = time.perf_counter_ns()
+    if profile is not None:
+        prefix = os.path.join(profile_dir, f'day{day:02}.part{part}')
+        answer = profile_compute(compute, s, profile, prefix)
+    elif cache:
+        answer = cached_answer(compute, s)
+    else:
+        answer = compute(s)
+    t = time.perf_counter_ns() - before
+    work = dict(counters)
+    counters.clear()
+    return answer, t, work
+
+
+def run_all() -> int:
+    import concurrent.futures
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument('days', type=int, nargs='*')
+    parser.add_argument('--jobs', '-j', type=int, default=os.cpu_count())
+    parser.add_argument('--db', default=BENCH_DB)
+    parser.add_argument(
+        '--cache', action='store_true',
+        help='reuse answers for unchanged solvers and inputs',
+    )
+    parser.add_argument(
+        '--profile', choices=PROFILERS,
+        help='profile each compute(), writing reports to --profile-dir',
+    )
+    parser.add_argument(
+        '--profile-dir', default=os.path.join(ROOT, 'profiles'),
+    )
+    parser.add_argument(
+        '--counters', action='store_true',
+        help='print the work counted by `support.count` in each solver',
+    )
+    args = parser.parse_args()
+
+    if args.counters:
+        # workers may be spawned rather than forked
+        os.environ['AOC_COUNTERS'] = '1'
+        enable_counters()
+
+    solvers = get_solvers(args.days)
+    if os.path.exists(args.db):
+        with contextlib.closing(open_bench_db(args.db)) as db:
+            timings = past_timings(db)
+    else:
+        timings = {}
+    # longest job first, unknown solvers are assumed to be slow
+    order = sorted(solvers, key=lambda k: -timings.get(k, sys.maxsize))
+
+    before = time.perf_counter_ns()
+    with concurrent.futures.ProcessPoolExecutor(args.jobs) as executor:
+        futures = {
+            k: executor.submit(
+                _run_solver, *k, args.cache, args.profile, args.profile_dir,
+            )
+            for k in order
+        }
+        # print in day order as soon as every earlier solver is done
+        for (day, part), future in sorted(futures.items()):
+            answer, t, work = future.result()
+            print(
+                f'{day:>2}.{part:<2} {format_ns(t):>10}  {answer}',
+                flush=True,
+            )
+            if work:
+                print(f'{"":15} {format_counters(work)}', flush=True)
+    print(f'> {format_ns(time.perf_counter_ns() - before)} total')
+    if args.profile:
+        print(f'> {args.profile} reports in {args.profile_dir}')
+
+    return 0
+
+
+def git_commit() -> str:
+    import subprocess
+
+    def _git(*cmd: str) -> str:
+        return subprocess.check_output(('git', *cmd), cwd=ROOT, text=True)
+
+    commit = _git('rev-parse', 'HEAD').strip()
+    if _git('status', '--porcelain', '--untracked-files=no').strip():
+        commit += '-dirty'
+    return commit
+
+
+def input_hash(s: str) -> str:
+    import hashlib
+
+    return hashlib.sha256(s.encode()).hexdigest()
+
+
+def open_bench_db(path: str) -> sqlite3.Connection:
+    import sqlite3
+
+    db = sqlite3.connect(path)
+    db.execute(
+        'CREATE TABLE IF NOT EXISTS results ('
+        '    commit_sha TEXT NOT NULL,'
+        '    day INT NOT NULL,'
+        '    part INT NOT NULL,'
+        '    input_hash TEXT NOT NULL,'
+        '    min_ns INT NOT NULL,'
+        '    median_ns INT NOT NULL,'
+        '    p95_ns INT NOT NULL,'
+        '    timestamp REAL NOT NULL,'
+        '    PRIMARY KEY (commit_sha, day, part, input_hash)'
+        ')',
+    )
+    return db
+
+
+def save_result(
+        db: sqlite3.Connection,
+        commit: str,
+        day: int,
+        part: int,
+        input_sha: str,
+        stats: Stats,
+) -> None:
+    db.execute(
+        'INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+        (commit, day, part, input_sha, *stats, time.time()),
+    )
+
+
+def load_results(
+        db: sqlite3.Connection,
+        commit: str,
+) -> dict[tuple[int, int, str], Stats]:
+    query = (
+        'SELECT day, part, input_hash, min_ns, median_ns, p95_ns '
+        'FROM results WHERE commit_sha = ?'
+    )
+    return {
+        (day, part, input_sha): Stats(*stats)
+        for day, part, input_sha, *stats in db.execute(query, (commit,))
+    }
+
+
+def previous_commit(db: sqlite3.Connection, commit: str) -> str | None:
+    query = (
+        'SELECT commit_sha FROM results WHERE commit_sha != ? '
+        'ORDER BY timestamp DESC LIMIT 1'
+    )
+    row = db.execute(query, (commit,)).fetchone()
+    return row[0] if row else None
+
+
+class Regression(NamedTuple):
+    day: int
+    part: int
+    baseline: Stats
+    current: Stats
+
+    @property
+    def ratio(self) -> float:
+        return self.current.median / self.baseline.median
+
+
+def find_regressions(
+        baseline: dict[tuple[int, int, str], Stats],
+        current: dict[tuple[int, int, str], Stats],
+        threshold: float,
+) -> list[Regression]:
+    regressions = []
+    for k, stats in sorted(current.items()):
+        if k not in baseline:  # new solver or a different input
+            continue
+        day, part, _ = k
+        regression = Regression(day, part, baseline[k], stats)
+        if regression.ratio > 1 + threshold:
+            regressions.append(regression)
+    return regressions
+
+
+def benchmark_compare() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--db', default=BENCH_DB)
+    parser.add_argument(
+        '--baseline',
+        help='commit to compare against (default: most recently saved)',
+    )
+    parser.add_argument(
+        '--commit', help='commit to check (default: current checkout)',
+    )
+    parser.add_argument(
+        '--threshold', type=float, default=.1,
+        help='allowed relative slowdown of the median (default: %(default)s)',
+    )
+    args = parser.parse_args()
+
+    commit = args.commit or git_commit()
+    with contextlib.closing(open_bench_db(args.db)) as db:
+        baseline_commit = args.baseline or previous_commit(db, commit)
+        if baseline_commit is None:
+            print('no baseline results saved, run `aoc-bench --save`')
+            return 1
+        baseline = load_results(db, baseline_commit)
+        current = load_results(db, commit)
+
+    if not current:
+        print(f'no results saved for {commit}, run `aoc-bench --save`')
+        return 1
+
+    print(f'comparing {commit} against {baseline_commit}')
+    regressions = find_regressions(baseline, current, args.threshold)
+    for regression in regressions:
+        print(
+            f'\033[41mREGRESSION\033[m {regression.day:>2}.{regression.part} '
+            f'{format_ns(regression.baseline.median)} -> '
+            f'{format_ns(regression.current.median)} '
+            f'({regression.ratio:.2f}x)',
+        )
+    return 1 if regressions else 0
+
+
+Generate: TypeAlias = 'Callable[[int, random.Random], Iterable[str]]'
+
+
+def parse_size(s: str) -> int:
+    """parses sizes like `512`, `64K`, `10M` or `1G` into bytes"""
+    units = {'K': 1 << 10, 'M': 1 << 20, 'G': 1 << 30}
+    s = s.strip().upper().removesuffix('B')
+    if s and s[-1] in units:
+        return int(float(s[:-1]) * units[s[-1]])
+    else:
+        return int(s)
+
+
+def generate_input(generate: Generate, size: int, seed: int = 0) -> str:
+    import random
+
+    return ''.join(generate(size, random.Random(seed)))
+
+
+def generator_main(generate: Generate) -> int:
+    import random
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--size', type=parse_size, default='10K')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', '-o', default='-')
+    args = parser.parse_args()
+
+    if args.output == '-':
+        f = sys.stdout
+    else:
+        f = open(args.output, 'w')
+    with f:
+        f.writelines(generate(args.size, random.Random(args.seed)))
+
+    return 0
+
+
+def load_generate(day: int) -> Generate:
+    return import_day(day, 'generate').generate
+
+
+def format_size(n: int) -> str:
+    for unit, scale in (('G', 1 << 30), ('M', 1 << 20), ('K', 1 << 10)):
+        if n >= scale:
+            return f'{n / scale:.3g}{unit}'
+    return f'{n}B'
+
+
+def fit_exponent(points: Sequence[tuple[float, float]]) -> float:
+    """least squares slope of log(time) on log(size), nan if sizes are equal"""
+    import statistics
+
+    xs = [math.log(size) for size, _ in points]
+    ys = [math.log(t) for _, t in points]
+    x_mean = statistics.fmean(xs)
+    y_mean = statistics.fmean(ys)
+    num = sum((x - x_mean) * (y - y_mean) for x, y in zip(xs, ys))
+    den = sum((x - x_mean) ** 2 for x in xs)
+    if den == 0:
+        return math.nan
+    return num / den
+
+
+def predict_time(points: Sequence[tuple[float, float]], size: float) -> float:
+    """time at `size`, extrapolated from the last point by `fit_exponent`"""
+    last_size, last_t = points[-1]
+    return last_t * (size / last_size) ** fit_exponent(points)
+
+
+def _growth_factor(s: str) -> float:
+    factor = float(s)
+    if factor <= 1:
+        raise argparse.ArgumentTypeError(f'must be more than 1: {s}')
+    return factor
+
+
+def benchmark_scaling() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('days', type=int, nargs='*')
+    parser.add_argument('--start', type=parse_size, default='1K')
+    parser.add_argument('--factor', type=_growth_factor, default=2)
+    parser.add_argument('--steps', type=int, default=6)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument(
+        '--max-time', type=float, default=2,
+        help=(
+            'stop growing a solver once a run takes this long, or is '
+            'predicted to from the runs so far (seconds)'
+        ),
+    )
+    args = parser.parse_args()
+
+    for day, part in get_solvers(args.days):
+        compute = load_compute(day, part)
+        generate = load_generate(day)
+
+        points = []
+        skipped = ''
+        size = args.start
+        for _ in range(args.steps):
+            s = generate_input(generate, int(size), args.seed)
+            t = measure(compute, s, repeat=args.repeat, warmup=0).min
+            points.append((len(s), t))
+            if t > args.max_time * 1e9:
+                break
+            size *= args.factor
+            if len(points) >= 2:
+                # generators only roughly hit the requested size, so
+                # extrapolate from the size actually measured
+                next_size = len(s) * args.factor
+                predicted = predict_time(points, next_size)
+                if predicted > args.max_time * 1e9:
+                    skipped = (
+                        f', {format_size(int(next_size))}: '
+                        f'~{format_ns(predicted)}'
+                    )
+                    break
+
+        timings = ', '.join(
+            f'{format_size(size)}: {format_ns(t)}' for size, t in points
+        )
+        exponent = fit_exponent(points) if len(points) >= 2 else math.nan
+        if math.isnan(exponent):
+            estimate = 'O(?)'
+        else:
+            estimate = f'O(n^{exponent:.2f})'
+        print(
+            f'{day:>2}.{part:<2} {estimate:>10}  [{timings}{skipped}]',
+            flush=True,
+        )
+
+    return 0
 
 
 def _get_cookie_headers() -> dict[str, str]:
@@ -40,12 +788,213 @@ def _get_cookie_headers() -> dict[str, str]:
     return {'Cookie': contents, 'User-Agent': 'anthonywritescode, hi eric'}
 
 
+def _base_url() -> str:
+    return os.environ.get('AOC_URL', 'https://adventofcode.com').rstrip('/')
+
+
 def get_input(year: int, day: int) -> str:
-    url = f'https://adventofcode.com/{year}/day/{day}/input'
+    import urllib.request
+
+    url = f'{_base_url()}/{year}/day/{day}/input'
     req = urllib.request.Request(url, headers=_get_cookie_headers())
     return urllib.request.urlopen(req).read().decode()
 
 
+def input_cache_dir() -> str:
+    """$AOC_CACHE_DIR, else `aoc` under the XDG cache directory"""
+    if os.environ.get('AOC_CACHE_DIR'):
+        return os.environ['AOC_CACHE_DIR']
+    xdg = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache')
+    return os.path.join(xdg, 'aoc')
+
+
+def _cache_index(cache_dir: str, year: int, day: int) -> str:
+    return os.path.join(cache_dir, 'index', f'{year}-{day:02}.json')
+
+
+def _cache_object(cache_dir: str, sha: str) -> str:
+    return os.path.join(cache_dir, 'objects', sha[:2], sha)
+
+
+def _write_atomic(path: str, contents: str) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f'{path}.{os.getpid()}.tmp'
+    with open(tmp, 'w') as f:
+        f.write(contents)
+    os.replace(tmp, path)
+
+
+def cached_input(year: int, day: int, cache_dir: str) -> str | None:
+    """the cached input for year / day, or None if absent or corrupt"""
+    import json
+
+    try:
+        with open(_cache_index(cache_dir, year, day)) as f:
+            sha = json.load(f)['sha256']
+        with open(_cache_object(cache_dir, sha)) as f:
+            s = f.read()
+    except (OSError, KeyError, ValueError):
+        return None
+
+    if input_hash(s) != sha:
+        return None
+    else:
+        return s
+
+
+def cache_input(year: int, day: int, s: str, cache_dir: str) -> str:
+    """stores `s` by content hash and points year / day at it"""
+    import json
+
+    sha = input_hash(s)
+    obj = _cache_object(cache_dir, sha)
+    if not os.path.exists(obj):
+        _write_atomic(obj, s)
+    meta = {'year': year, 'day': day, 'sha256': sha, 'fetched': time.time()}
+    _write_atomic(_cache_index(cache_dir, year, day), json.dumps(meta))
+    return sha
+
+
+def fetch_input(
+        year: int,
+        day: int,
+        *,
+        cache_dir: str | None = None,
+        offline: bool = False,
+        retries: int = 5,
+        sleep: Callable[[float], object] = time.sleep,
+) -> str:
+    """
+    Returns the input for year / day, from the cache when possible.
+
+    Only a cache miss touches the network (and so can sleep between
+    retries); `offline` turns a miss into an error instead.
+    """
+    import urllib.error
+
+    if cache_dir is not None:
+        s = cached_input(year, day, cache_dir)
+        if s is not None:
+            return s
+
+    if offline:
+        raise SystemExit(f'{year} day {day}: not in the input cache')
+
+    for i in range(retries):
+        try:
+            s = get_input(year, day)
+        except urllib.error.URLError as e:
+            print(f'zzz: not ready yet: {e}')
+            if i < retries - 1:
+                sleep(1)
+        else:
+            break
+    else:
+        raise SystemExit('timed out after attempting many times')
+
+    if cache_dir is not None:
+        cache_input(year, day, s, cache_dir)
+    return s
+
+
+def answer_cache_path() -> str:
+    """$AOC_ANSWER_CACHE, else `answers.db` in the input cache directory"""
+    return (
+        os.environ.get('AOC_ANSWER_CACHE') or
+        os.path.join(input_cache_dir(), 'answers.db')
+    )
+
+
+def open_answer_cache(path: str) -> sqlite3.Connection:
+    import sqlite3
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    db = sqlite3.connect(path, timeout=30)
+    db.execute(
+        'CREATE TABLE IF NOT EXISTS answers ('
+        '    day INT NOT NULL,'
+        '    part INT NOT NULL,'
+        '    input_hash TEXT NOT NULL,'
+        '    source_hash TEXT NOT NULL,'
+        '    answer TEXT NOT NULL,'
+        '    last_used REAL NOT NULL,'
+        '    PRIMARY KEY (day, part, input_hash, source_hash)'
+        ')',
+    )
+    return db
+
+
+SOLVER_RE = re.compile(r'day(\d+)[/\\]part(\d+)\.py$')
+
+
+def source_hash(compute: Callable[..., object]) -> str:
+    """hash of the module defining `compute` and of `support` itself"""
+    import hashlib
+    import inspect
+
+    h = hashlib.sha256()
+    for filename in (inspect.getfile(compute), __file__):
+        with open(filename, 'rb') as f:
+            h.update(f.read())
+    return h.hexdigest()
+
+
+def cached_answer(
+        compute: Callable[[str], object],
+        s: str,
+        *,
+        path: str | None = None,
+        max_entries: int = 1000,
+) -> object:
+    """
+    `compute(s)`, remembered on disk until the input or the solver changes.
+
+    The least recently used answers beyond `max_entries` are evicted.
+    Set $AOC_NO_CACHE=1 to always recompute.
+    """
+    import inspect
+    import json
+
+    if os.environ.get('AOC_NO_CACHE') == '1':
+        return compute(s)
+
+    match = SOLVER_RE.search(os.path.abspath(inspect.getfile(compute)))
+    if match is None:
+        raise ValueError(f'{compute!r} is not defined in a dayNN/partN.py')
+    key = (int(match[1]), int(match[2]), input_hash(s), source_hash(compute))
+
+    path = path or answer_cache_path()
+    with contextlib.closing(open_answer_cache(path)) as db:
+        query = (
+            'SELECT answer FROM answers '
+            'WHERE day = ? AND part = ? AND input_hash = ? AND source_hash = ?'
+        )
+        row = db.execute(query, key).fetchone()
+        if row is not None:
+            with db:
+                db.execute(
+                    'UPDATE answers SET last_used = ? '
+                    'WHERE day = ? AND part = ? AND input_hash = ? '
+                    'AND source_hash = ?',
+                    (time.time(), *key),
+                )
+            return json.loads(row[0])
+
+        answer = compute(s)
+        with db:
+            db.execute(
+                'INSERT OR REPLACE INTO answers VALUES (?, ?, ?, ?, ?, ?)',
+                (*key, json.dumps(answer), time.time()),
+            )
+            db.execute(
+                'DELETE FROM answers WHERE rowid NOT IN ('
+                '    SELECT rowid FROM answers ORDER BY last_used DESC LIMIT ?'
+                ')',
+                (max_entries,),
+            )
+        return answer
+
+
 def get_year_day() -> tuple[int, int]:
     cwd = os.getcwd()
     day_s = os.path.basename(cwd)
@@ -59,23 +1008,31 @@ def get_year_day() -> tuple[int, int]:
 
 def download_input() -> int:
     parser = argparse.ArgumentParser()
-    parser.parse_args()
+    parser.add_argument(
+        '--offline', action='store_true',
+        default=os.environ.get('AOC_OFFLINE') == '1',
+        help='only use the input cache (default: $AOC_OFFLINE=1)',
+    )
+    parser.add_argument('--no-cache', action='store_true')
+    parser.add_argument('--cache-dir', default=input_cache_dir())
+    args = parser.parse_args()
 
     year, day = get_year_day()
 
-    for i in range(5):
-        try:
-            s = get_input(year, day)
-        except urllib.error.URLError as e:
-            print(f'zzz: not ready yet: {e}')
-            time.sleep(1)
-        else:
-            break
-    else:
-        raise SystemExit('timed out after attempting many times')
+    s = fetch_input(
+        year, day,
+        cache_dir=None if args.no_cache else args.cache_dir,
+        offline=args.offline,
+    )
 
-    with open('input.txt', 'w') as f:
-        f.write(s)
+    try:
+        with open('input.txt') as f:
+            unchanged = f.read() == s
+    except OSError:
+        unchanged = False
+    if not unchanged:
+        with open('input.txt', 'w') as f:
+            f.write(s)
 
     lines = s.splitlines()
     if len(lines) > 10:
@@ -96,9 +1053,12 @@ ALREADY_DONE = re.compile(r"You don't seem to be solving.*\?")
 
 
 def _post_answer(year: int, day: int, part: int, answer: int) -> str:
+    import urllib.parse
+    import urllib.request
+
     params = urllib.parse.urlencode({'level': part, 'answer': answer})
     req = urllib.request.Request(
-        f'https://adventofcode.com/{year}/day/{day}/answer',
+        f'{_base_url()}/{year}/day/{day}/answer',
         method='POST',
         data=params.encode(),
         headers=_get_cookie_headers(),
@@ -152,6 +1112,193 @@ def submit_25_pt2() -> int:
         return 1
 
 
+WAIT_S = re.compile(r'You have (?:(\d+)m )?(\d+)s left to wait')
+WAIT_MINUTES = re.compile(r'[Pp]lease wait (one|\d+) minutes? before trying')
+
+
+def parse_wait(contents: str) -> float | None:
+    """seconds the answer page asks us to wait before submitting again"""
+    match = WAIT_S.search(contents)
+    if match:
+        return int(match[1] or 0) * 60 + int(match[2])
+    match = WAIT_MINUTES.search(contents)
+    if match:
+        return 60 * (1 if match[1] == 'one' else int(match[1]))
+    return None
+
+
+class Submission(NamedTuple):
+    day: int
+    part: int
+    answer: int
+
+
+class AnswerClient:
+    """posts answers over a single keep-alive connection"""
+
+    def __init__(self, base_url: str | None = None) -> None:
+        import http.client
+        import urllib.parse
+
+        url = urllib.parse.urlsplit(base_url or _base_url())
+        if url.scheme == 'https':
+            self._conn: http.client.HTTPConnection
+            self._conn = http.client.HTTPSConnection(url.netloc)
+        else:
+            self._conn = http.client.HTTPConnection(url.netloc)
+        self._prefix = url.path.rstrip('/')
+        self._headers = {
+            **_get_cookie_headers(),
+            'Content-Type': 'application/x-www-form-urlencoded',
+        }
+
+    def _close_if_dropped(self) -> None:
+        import select
+
+        # an idle keep-alive connection only becomes readable once the
+        # server has closed it, http.client reconnects on the next request
+        sock = self._conn.sock
+        if sock is not None and select.select([sock], [], [], 0)[0]:
+            self._conn.close()
+
+    def post(self, year: int, day: int, part: int, answer: int) -> str:
+        """
+        Posts an answer once, an error after sending it is not retried as
+        the server may have already counted it.
+        """
+        import urllib.parse
+
+        path = f'{self._prefix}/{year}/day/{day}/answer'
+        body = urllib.parse.urlencode({'level': part, 'answer': answer})
+        self._close_if_dropped()
+        self._conn.request('POST', path, body, self._headers)
+        return self._conn.getresponse().read().decode()
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+def submit_batch(
+        year: int,
+        submissions: Iterable[Submission],
+        post: Callable[[int, int, int, int], str],
+        *,
+        sleep: Callable[[float], object] = time.sleep,
+        clock: Callable[[], float] = time.monotonic,
+) -> list[tuple[Submission, str]]:
+    """
+    Submits answers in order, waiting out the rate limit between them.
+
+    Returns each submission with its page contents, in the order they were
+    answered.  A `TOO_QUICK` response requeues the submission at the front,
+    to be sent exactly when the wait it reports runs out.
+    """
+    queue = collections.deque(submissions)
+    not_before = clock()
+    ret = []
+    while queue:
+        submission = queue.popleft()
+        delay = not_before - clock()
+        if delay > 0:
+            sleep(delay)
+
+        contents = post(year, *submission)
+        wait = parse_wait(contents)
+        if wait is not None:
+            not_before = clock() + wait
+
+        if TOO_QUICK.search(contents):
+            if wait is None:
+                not_before = clock() + 60
+            queue.appendleft(submission)
+        else:
+            ret.append((submission, contents))
+    return ret
+
+
+def _default_year() -> int | None:
+    name = os.path.basename(ROOT)
+    if name.startswith('aoc') and name[len('aoc'):].isdigit():
+        return int(name[len('aoc'):])
+    else:
+        return None
+
+
+def submit_batch_main() -> int:
+    parser = argparse.ArgumentParser(
+        description='submit `day part answer` lines from files or stdin',
+    )
+    parser.add_argument('filenames', nargs='*')
+    parser.add_argument(
+        '--year', type=int,
+        default=_default_year(), required=_default_year() is None,
+    )
+    args = parser.parse_args()
+
+    lines: list[str] = []
+    if args.filenames:
+        for filename in args.filenames:
+            with open(filename) as f:
+                lines.extend(f)
+    else:
+        lines.extend(sys.stdin)
+    submissions = [
+        Submission(*(int(part) for part in line.split()))
+        for line in lines
+        if line.strip()
+    ]
+
+    client = AnswerClient()
+    try:
+        results = submit_batch(args.year, submissions, client.post)
+    finally:
+        client.close()
+
+    ret = 0
+    for submission, contents in results:
+        prefix = f'{submission.day:>2}.{submission.part} {submission.answer}:'
+        if RIGHT in contents:
+            print(f'{prefix} \033[42m{RIGHT}\033[m')
+            continue
+
+        ret = 1
+        for error_regex in (WRONG, ALREADY_DONE):
+            error_match = error_regex.search(contents)
+            if error_match:
+                print(f'{prefix} \033[41m{error_match[0]}\033[m')
+                break
+        else:
+            print(f'{prefix} {contents}')
+    return ret
+
+
+def iter_lines(f: Iterable[str]) -> Generator[str, None, None]:
+    """lines of an open file without their newlines, read lazily"""
+    for line in f:
+        yield line.rstrip('\n')
+
+
+def iter_records(lines: Iterable[str]) -> Generator[list[str], None, None]:
+    """groups of lines separated by blank lines"""
+    record: list[str] = []
+    for line in lines:
+        if line:
+            record.append(line)
+        elif record:
+            yield record
+            record = []
+    if record:
+        yield record
+
+
+@contextlib.contextmanager
+def mmap_input(filename: str) -> Generator[mmap.mmap, None, None]:
+    """read-only bytes view of a file which is paged in on demand"""
+    with open(filename, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+            yield m
+
+
 def adjacent_4(x: int, y: int) -> Generator[tuple[int, int], None, None]:
     yield x, y - 1
     yield x + 1, y
@@ -167,6 +1314,50 @@ def adjacent_8(x: int, y: int) -> Generator[tuple[int, int], None, None]:
             yield x + x_d, y + y_d
 
 
+_ADJACENT_4 = tuple(adjacent_4(0, 0))
+_ADJACENT_8 = tuple(adjacent_8(0, 0))
+
+
+def adjacent_4_many(
+        points: Iterable[tuple[int, int]],
+) -> list[tuple[int, int]]:
+    """the `adjacent_4` neighbours of each point, 4 per point"""
+    return [
+        (x + dx, y + dy)
+        for x, y in points
+        for dx, dy in _ADJACENT_4
+    ]
+
+
+def adjacent_8_many(
+        points: Iterable[tuple[int, int]],
+) -> list[tuple[int, int]]:
+    """the `adjacent_8` neighbours of each point, 8 per point"""
+    return [
+        (x + dx, y + dy)
+        for x, y in points
+        for dx, dy in _ADJACENT_8
+    ]
+
+
+def occupancy_8(
+        occupied: Container[tuple[int, int]],
+        points: Iterable[tuple[int, int]],
+) -> list[int]:
+    """
+    for each point, a bitmask of its neighbours in `occupied` where bit k is
+    the k-th neighbour yielded by `adjacent_8`
+    """
+    ret = []
+    for x, y in points:
+        mask = 0
+        for bit, (dx, dy) in enumerate(_ADJACENT_8):
+            if (x + dx, y + dy) in occupied:
+                mask |= 1 << bit
+        ret.append(mask)
+    return ret
+
+
 def parse_point_comma(s: str) -> tuple[int, int]:
     a_s, b_s = s.split(',')
     return int(a_s), int(b_s)
@@ -189,6 +1380,196 @@ def parse_coords_hash(s: str) -> set[tuple[int, int]]:
     return coords
 
 
+class ByteGrid(NamedTuple):
+    """
+    a rectangular text grid left as raw bytes: cell (x, y) is the byte at
+    `y * stride + x` (the stride includes the newline)
+    """
+    data: bytes | mmap.mmap
+    width: int
+    height: int
+    stride: int
+
+    def at(self, x: int, y: int) -> int:
+        return self.data[y * self.stride + x]
+
+
+def parse_grid_bytes(b: bytes | mmap.mmap) -> ByteGrid:
+    width = b.find(b'\n')
+    if width == -1:
+        width = len(b)
+    stride = width + 1
+    # the final newline is optional
+    return ByteGrid(b, width, (len(b) + 1) // stride, stride)
+
+
+@contextlib.contextmanager
+def mmap_grid(filename: str) -> Generator[ByteGrid, None, None]:
+    with mmap_input(filename) as m:
+        yield parse_grid_bytes(m)
+
+
+class Grid2D:
+    """
+    a dense grid of bytes covering `bounds`, addressed by integer index
+
+    cell (x, y) lives at `(y - y_min) * width + (x - x_min)` so neighbours
+    are a constant index offset away (see `offsets_4` / `offsets_8`)
+    """
+
+    def __init__(
+            self,
+            width: int,
+            height: int,
+            *,
+            x_min: int = 0,
+            y_min: int = 0,
+            fill: int = 0,
+    ) -> None:
+        self.width = width
+        self.height = height
+        self.x_min = x_min
+        self.y_min = y_min
+        self.cells = bytearray([fill]) * (width * height)
+        # same order as `adjacent_4` / `adjacent_8`
+        self.offsets_4 = (-width, 1, width, -1)
+        self.offsets_8 = (
+            -width - 1, -width, -width + 1,
+            -1, 1,
+            width - 1, width, width + 1,
+        )
+
+    @classmethod
+    def from_bytes(cls, grid: ByteGrid) -> Grid2D:
+        ret = cls(grid.width, grid.height)
+        for y in range(grid.height):
+            start = y * grid.stride
+            ret.cells[y * ret.width:(y + 1) * ret.width] = (
+                grid.data[start:start + grid.width]
+            )
+        return ret
+
+    @classmethod
+    def from_coords(
+            cls,
+            coords: Iterable[tuple[int, int]],
+            *,
+            margin: int = 0,
+    ) -> Grid2D:
+        """a grid with 1 at each of `coords` and `margin` empty cells around"""
+        coords = tuple(coords)
+        bx, by = bounds(coords)
+        ret = cls(
+            bx.max - bx.min + 1 + 2 * margin,
+            by.max - by.min + 1 + 2 * margin,
+            x_min=bx.min - margin,
+            y_min=by.min - margin,
+        )
+        for x, y in coords:
+            ret.cells[ret.index(x, y)] = 1
+        return ret
+
+    @property
+    def bounds(self) -> tuple[Bound, Bound]:
+        return (
+            Bound(self.x_min, self.x_min + self.width - 1),
+            Bound(self.y_min, self.y_min + self.height - 1),
+        )
+
+    def index(self, x: int, y: int) -> int:
+        return (y - self.y_min) * self.width + (x - self.x_min)
+
+    def coords(self, i: int) -> tuple[int, int]:
+        y, x = divmod(i, self.width)
+        return x + self.x_min, y + self.y_min
+
+    def __contains__(self, pt: tuple[int, int]) -> bool:
+        x, y = pt
+        return (
+            0 <= x - self.x_min < self.width and
+            0 <= y - self.y_min < self.height
+        )
+
+    def on_border(self, i: int) -> bool:
+        y, x = divmod(i, self.width)
+        return x in (0, self.width - 1) or y in (0, self.height - 1)
+
+    def neighbors_4(self, i: int) -> list[int]:
+        """indices of the in-bounds orthogonal neighbours of `i`"""
+        y, x = divmod(i, self.width)
+        ret = []
+        if y > 0:
+            ret.append(i - self.width)
+        if x < self.width - 1:
+            ret.append(i + 1)
+        if y < self.height - 1:
+            ret.append(i + self.width)
+        if x > 0:
+            ret.append(i - 1)
+        return ret
+
+    def _rows(self) -> list[int]:
+        # each row packed into one int, a byte per cell
+        width = self.width
+        return [
+            int.from_bytes(self.cells[y * width:(y + 1) * width], 'little')
+            for y in range(self.height)
+        ]
+
+    def count_neighbors_8(self) -> bytearray:
+        """
+        for every cell, how many of its 8 neighbours are nonzero
+
+        cells must be 0 / 1.  each row is packed into one int (a byte per
+        cell) so shifting and adding sums a whole row at once.
+        """
+        width = self.width
+        mask = (1 << (8 * width)) - 1
+        rows = self._rows()
+        # each cell plus its left and right neighbour
+        triples = [((row << 8) & mask) + row + (row >> 8) for row in rows]
+
+        ret = bytearray()
+        for y, row in enumerate(rows):
+            total = triples[y] - row
+            if y > 0:
+                total += triples[y - 1]
+            if y < self.height - 1:
+                total += triples[y + 1]
+            ret += total.to_bytes(width, 'little')
+        return ret
+
+    def neighbor_masks_8(self) -> bytearray:
+        """
+        for every cell, a bitmask of its nonzero neighbours where bit k is
+        the neighbour at `offsets_8[k]`
+
+        cells must be 0 / 1, computed a whole row at a time like
+        `count_neighbors_8`.
+        """
+        width = self.width
+        mask = (1 << (8 * width)) - 1
+        rows = self._rows()
+
+        ret = bytearray()
+        for y, row in enumerate(rows):
+            above = rows[y - 1] if y > 0 else 0
+            below = rows[y + 1] if y < self.height - 1 else 0
+            # `<< 8` moves the left neighbour into place, `>> 8` the right
+            masks = (
+                ((above << 8) & mask) |
+                above << 1 |
+                (above >> 8) << 2 |
+                ((row << 8) & mask) << 3 |
+                (row >> 8) << 4 |
+                ((below << 8) & mask) << 5 |
+                below << 6 |
+                (below >> 8) << 7
+            )
+            ret += masks.to_bytes(width, 'little')
+        return ret
+
+
 def parse_numbers_split(s: str) -> list[int]:
     return [int(x) for x in s.split()]
 
@@ -197,6 +1578,84 @@ def parse_numbers_comma(s: str) -> list[int]:
     return [int(x) for x in s.strip().split(',')]
 
 
+# the bulk parsers below split in C and hand `int` whole byte strings,
+# storing the results unboxed in an array('q')
+
+def parse_numbers_array(b: bytes) -> array.array[int]:
+    """whitespace separated integers"""
+    return array.array('q', map(int, b.split()))
+
+
+def parse_numbers_comma_array(b: bytes) -> array.array[int]:
+    """comma separated integers (surrounding whitespace is fine)"""
+    return array.array('q', map(int, b.split(b',')))
+
+
+_NON_DIGITS = bytes(
+    c if bytes((c,)).isdigit() else ord(' ') for c in range(256)
+)
+_NON_INTS = bytes(c if c == ord('-') else _NON_DIGITS[c] for c in range(256))
+
+
+def parse_ints_array(b: bytes, *, signed: bool = True) -> array.array[int]:
+    """
+    Every integer in `b`, with anything else separating them.
+
+    `signed=False` treats `-` as a separator too.  Signed parsing falls back
+    to a regex when a `-` is not followed by a digit (`->`), but a `-` right
+    before a digit is always a sign: ranges like `2-4` need `signed=False`.
+    """
+    if signed:
+        try:
+            return array.array('q', map(int, b.translate(_NON_INTS).split()))
+        except ValueError:
+            return array.array('q', map(int, re.findall(rb'-?\d+', b)))
+    else:
+        return array.array('q', map(int, b.translate(_NON_DIGITS).split()))
+
+
+def parse_points_array(
+        b: bytes,
+        dims: int = 2,
+        *,
+        signed: bool = True,
+) -> array.array[int]:
+    """`parse_ints_array` of `dims`-dimensional points, flat: x0, y0, x1..."""
+    ret = parse_ints_array(b, signed=signed)
+    if len(ret) % dims:
+        raise ValueError(f'{len(ret)} integers is not a multiple of {dims}')
+    return ret
+
+
+class IntRecords(NamedTuple):
+    """fixed width records of integers, row-major in a single array('q')"""
+    data: array.array[int]
+    columns: int
+
+    @property
+    def rows(self) -> int:
+        return len(self.data) // self.columns
+
+    def row(self, i: int) -> array.array[int]:
+        return self.data[i * self.columns:(i + 1) * self.columns]
+
+    def column(self, i: int) -> array.array[int]:
+        return self.data[i::self.columns]
+
+    def records(self) -> Iterator[tuple[int, ...]]:
+        return zip(*(self.column(i) for i in range(self.columns)))
+
+
+def parse_int_records(
+        b: bytes,
+        columns: int,
+        *,
+        signed: bool = True,
+) -> IntRecords:
+    """every integer in `b`, in one pass, as records of `columns` integers"""
+    return IntRecords(parse_points_array(b, columns, signed=signed), columns)
+
+
 class Bound(NamedTuple):
     min: int
     max: int
@@ -235,20 +1694,224 @@ class Direction4(enum.Enum):
     def _vals(self) -> tuple[Direction4, ...]:
         return tuple(type(self).__members__.values())
 
-    @property
+    # cached on the member after the first lookup: a plain attribute read
+    @functools.cached_property
     def cw(self) -> Direction4:
         vals = self._vals
         return vals[(vals.index(self) + 1) % len(vals)]
 
-    @property
+    @functools.cached_property
     def ccw(self) -> Direction4:
         vals = self._vals
         return vals[(vals.index(self) - 1) % len(vals)]
 
-    @property
+    @functools.cached_property
     def opposite(self) -> Direction4:
         vals = self._vals
         return vals[(vals.index(self) + 2) % len(vals)]
 
     def apply(self, x: int, y: int, *, n: int = 1) -> tuple[int, int]:
         return self.x * n + x, self.y * n + y
+
+
+def bfs(
+        starts: Iterable[H],
+        neighbors: Callable[[H], Iterable[H]],
+) -> dict[H, int]:
+    """steps from the nearest of `starts` to every reachable node"""
+    dist = dict.fromkeys(starts, 0)
+    frontier = list(dist)
+    steps = 0
+    hits = 0
+    while frontier:
+        steps += 1
+        count('bfs states', len(frontier))
+        new_frontier = []
+        for node in frontier:
+            for n in neighbors(node):
+                if n not in dist:
+                    dist[n] = steps
+                    new_frontier.append(n)
+                else:
+                    hits += 1
+        frontier = new_frontier
+    count('bfs seen hits', hits)
+    return dist
+
+
+def bfs_int(
+        adjacency: Sequence[Iterable[int]],
+        starts: Iterable[int],
+) -> list[int]:
+    """`bfs` over nodes `0..len(adjacency)`, -1 marks unreachable nodes"""
+    dist = [-1] * len(adjacency)
+    frontier = list(starts)
+    for node in frontier:
+        dist[node] = 0
+    steps = 0
+    hits = 0
+    while frontier:
+        steps += 1
+        count('bfs states', len(frontier))
+        new_frontier = []
+        for node in frontier:
+            for n in adjacency[node]:
+                if dist[n] < 0:
+                    dist[n] = steps
+                    new_frontier.append(n)
+                else:
+                    hits += 1
+        frontier = new_frontier
+    count('bfs seen hits', hits)
+    return dist
+
+
+def bfs_01(
+        edges: Callable[[H], Iterable[tuple[H, int]]],
+        starts: Iterable[H],
+) -> dict[H, int]:
+    """shortest distances when `edges` yields (node, 0 or 1 weight) pairs"""
+    dist = dict.fromkeys(starts, 0)
+    todo = collections.deque((0, node) for node in dist)
+    while todo:
+        cost, node = todo.popleft()
+        if cost > dist[node]:
+            continue
+        for n, weight in edges(node):
+            new_cost = cost + weight
+            if new_cost < dist.get(n, sys.maxsize):
+                dist[n] = new_cost
+                if weight:
+                    todo.append((new_cost, n))
+                else:
+                    todo.appendleft((new_cost, n))
+    return dist
+
+
+def dijkstra(
+        edges: Callable[[H], Iterable[tuple[H, int]]],
+        starts: Iterable[H],
+        *,
+        goal: H | None = None,
+) -> dict[H, int]:
+    """
+    Shortest distances from `starts`, stopping early once `goal` is settled
+    (only distances up to the goal's are final then).
+
+    Rather than decreasing keys, stale heap entries are skipped when popped.
+    Nodes must be orderable to break ties in the heap.
+    """
+    import heapq
+
+    dist = dict.fromkeys(starts, 0)
+    heap = [(0, node) for node in dist]
+    heapq.heapify(heap)
+    pushes = len(heap)
+    while heap:
+        cost, node = heapq.heappop(heap)
+        if cost > dist[node]:
+            continue
+        elif node == goal:
+            break
+        for n, weight in edges(node):
+            new_cost = cost + weight
+            if new_cost < dist.get(n, sys.maxsize):
+                dist[n] = new_cost
+                heapq.heappush(heap, (new_cost, n))
+                pushes += 1
+    count('heap pushes', pushes)
+    return dist
+
+
+def astar(
+        edges: Callable[[H], Iterable[tuple[H, int]]],
+        start: H,
+        goal: H,
+        heuristic: Callable[[H], int],
+) -> int | None:
+    """
+    Cost of the cheapest path from `start` to `goal`, or None.
+
+    `heuristic` must never overestimate the remaining cost.
+    """
+    import heapq
+
+    dist = {start: 0}
+    heap = [(heuristic(start), 0, start)]
+    pushes = 1
+    try:
+        while heap:
+            _, cost, node = heapq.heappop(heap)
+            if node == goal:
+                return cost
+            elif cost > dist[node]:
+                continue
+            for n, weight in edges(node):
+                new_cost = cost + weight
+                if new_cost < dist.get(n, sys.maxsize):
+                    dist[n] = new_cost
+                    estimate = new_cost + heuristic(n)
+                    heapq.heappush(heap, (estimate, new_cost, n))
+                    pushes += 1
+        return None
+    finally:
+        count('heap pushes', pushes)
+
+
+def bfs_bidirectional(
+        neighbors: Callable[[H], Iterable[H]],
+        start: H,
+        goal: H,
+        *,
+        reverse_neighbors: Callable[[H], Iterable[H]] | None = None,
+) -> int | None:
+    """
+    Steps from `start` to `goal`, or None, searching from both ends.
+
+    `reverse_neighbors` (the nodes with an edge into a node) defaults to
+    `neighbors`, for undirected graphs.
+    """
+    if start == goal:
+        return 0
+    if reverse_neighbors is None:
+        reverse_neighbors = neighbors
+
+    dist_a, dist_b = {start: 0}, {goal: 0}
+    frontier_a, frontier_b = [start], [goal]
+    step_a = step_b = 0
+    while frontier_a and frontier_b:
+        # expand the smaller frontier
+        if len(frontier_a) <= len(frontier_b):
+            step_a += 1
+            frontier_a, found = _bfs_step(
+                frontier_a, neighbors, dist_a, step_a, dist_b,
+            )
+        else:
+            step_b += 1
+            frontier_b, found = _bfs_step(
+                frontier_b, reverse_neighbors, dist_b, step_b, dist_a,
+            )
+        if found is not None:
+            return found
+    return None
+
+
+def _bfs_step(
+        frontier: list[H],
+        neighbors: Callable[[H], Iterable[H]],
+        dist: dict[H, int],
+        steps: int,
+        other: dict[H, int],
+) -> tuple[list[H], int | None]:
+    count('bfs states', len(frontier))
+    best = None
+    new_frontier = []
+    for node in frontier:
+        for n in neighbors(node):
+            if n in dist:
+                continue
+            dist[n] = steps
+            new_frontier.append(n)
+            if n in other and (best is None or steps + other[n] < best):
+                best = steps + other[n]
+    return new_frontier, best
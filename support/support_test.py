@@ -1,5 +1,21 @@
 from __future__ import annotations
 
+import http.server
+import importlib.util
+import io
+import json
+import math
+import pathlib
+import sys
+import threading
+import time
+import tracemalloc
+from typing import Any
+from typing import Callable
+from typing import Generator
+
+import pytest
+
 import support
 
 
@@ -53,3 +69,758 @@ def test_direction4() -> None:
     assert support.Direction4.UP.ccw is support.Direction4.LEFT
     assert support.Direction4.UP.opposite is support.Direction4.DOWN
     assert support.Direction4.UP.apply(0, 0) == (0, -1)
+
+
+def test_summarize() -> None:
+    stats = support.summarize([5, 1, 3, 2, 4])
+    assert stats == support.Stats(min=1, median=3, p95=5)
+
+
+def test_format_ns() -> None:
+    assert support.format_ns(12) == '12 ns'
+    assert support.format_ns(1500) == '1.5 μs'
+    assert support.format_ns(2_000_000_000) == '2 s'
+
+
+def test_get_solvers() -> None:
+    solvers = support.get_solvers([1, 2])
+    assert solvers == [(1, 1), (1, 2), (2, 1), (2, 2)]
+
+
+def test_timing_json_sink(capsys: pytest.CaptureFixture[str]) -> None:
+    sink = io.StringIO()
+    with support.timing('hello', memory=True, sink=sink):
+        [0] * 1000
+
+    record = json.loads(sink.getvalue())
+    assert record['name'] == 'hello'
+    assert record['wall_ns'] > 0
+    assert record['cpu_ns'] >= 0
+    assert record['peak_alloc'] >= 8000
+    assert record['max_rss'] > 0
+    assert capsys.readouterr().err.endswith('(hello)\n')
+
+
+def test_timing_memory_keeps_callers_tracing() -> None:
+    tracemalloc.start()
+    try:
+        with support.timing(memory=True, sink=io.StringIO()):
+            with support.timing(memory=True, sink=io.StringIO()):
+                pass
+            assert tracemalloc.is_tracing()
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
+
+
+def test_find_regressions(tmp_path: pathlib.Path) -> None:
+    db = support.open_bench_db(str(tmp_path.joinpath('bench.db')))
+    support.save_result(db, 'old', 20, 1, 'h', support.Stats(9, 10, 11))
+    support.save_result(db, 'old', 20, 2, 'h', support.Stats(9, 10, 11))
+    support.save_result(db, 'new', 20, 1, 'h', support.Stats(9, 15, 16))
+    support.save_result(db, 'new', 20, 2, 'h', support.Stats(9, 10, 11))
+    support.save_result(db, 'new', 21, 1, 'h', support.Stats(9, 99, 99))
+
+    assert support.previous_commit(db, 'new') == 'old'
+    baseline = support.load_results(db, 'old')
+    current = support.load_results(db, 'new')
+    regression, = support.find_regressions(baseline, current, .1)
+    assert (regression.day, regression.part) == (20, 1)
+    assert regression.ratio == 1.5
+    assert support.find_regressions(baseline, current, .5) == []
+
+
+@pytest.mark.parametrize(
+    ('s', 'expected'),
+    (
+        ('512', 512),
+        ('64K', 64 * 1024),
+        ('10m', 10 * 1024 * 1024),
+        ('1GB', 1024 ** 3),
+        ('1.5K', 1536),
+    ),
+)
+def test_parse_size(s: str, expected: int) -> None:
+    assert support.parse_size(s) == expected
+
+
+def test_fit_exponent() -> None:
+    linear = [(n, 3 * n) for n in (10, 20, 40, 80)]
+    quadratic = [(n, n * n + 1) for n in (10, 20, 40, 80)]
+    assert support.fit_exponent(linear) == pytest.approx(1)
+    assert support.fit_exponent(quadratic) == pytest.approx(2, abs=.01)
+
+
+def test_fit_exponent_same_size() -> None:
+    assert math.isnan(support.fit_exponent([(10, 1), (10, 2), (10, 3)]))
+
+
+@pytest.mark.parametrize('factor', ('1', '0.5', '-2'))
+def test_benchmark_scaling_rejects_factor(
+        factor: str,
+        monkeypatch: pytest.MonkeyPatch,
+        capsys: pytest.CaptureFixture[str],
+) -> None:
+    argv = ['aoc-bench-scaling', '1', '--factor', factor]
+    monkeypatch.setattr(sys, 'argv', argv)
+    with pytest.raises(SystemExit):
+        support.benchmark_scaling()
+    assert 'must be more than 1' in capsys.readouterr().err
+
+
+def test_predict_time() -> None:
+    quadratic = [(n, n * n) for n in (10, 20, 40)]
+    assert support.predict_time(quadratic, 80) == pytest.approx(6400)
+    assert support.predict_time(quadratic[:2], 40) == pytest.approx(1600)
+
+
+@pytest.mark.parametrize('day', range(1, 24))
+def test_generate_seeded(day: int) -> None:
+    generate = support.load_generate(day)
+    s = support.generate_input(generate, 512)
+    assert s.endswith('\n')
+    assert support.generate_input(generate, 512) == s
+    assert support.generate_input(generate, 512, seed=1) != s
+
+
+def test_format_size() -> None:
+    assert support.format_size(512) == '512B'
+    assert support.format_size(1536) == '1.5K'
+    assert support.format_size(1 << 30) == '1G'
+
+
+def test_past_timings(tmp_path: pathlib.Path) -> None:
+    db = support.open_bench_db(str(tmp_path.joinpath('bench.db')))
+    support.save_result(db, 'old', 1, 1, 'h', support.Stats(1, 10, 1))
+    support.save_result(db, 'new', 1, 1, 'h', support.Stats(1, 20, 1))
+    support.save_result(db, 'old', 1, 2, 'h', support.Stats(1, 30, 1))
+    assert support.past_timings(db) == {(1, 1): 20, (1, 2): 30}
+
+
+def test_iter_lines() -> None:
+    f = io.StringIO('a\nb\n\nc')
+    assert list(support.iter_lines(f)) == ['a', 'b', '', 'c']
+
+
+def test_iter_records() -> None:
+    lines = ['1', '2', '', '3', '', '', '4', '5']
+    records = list(support.iter_records(lines))
+    assert records == [['1', '2'], ['3'], ['4', '5']]
+
+
+def test_mmap_input(tmp_path: pathlib.Path) -> None:
+    f = tmp_path.joinpath('input.txt')
+    f.write_bytes(b'1\n2\n\n3\n')
+    with support.mmap_input(str(f)) as m:
+        assert m[:3] == b'1\n2'
+        assert m.find(b'\n\n') == 3
+
+
+def test_parse_grid_bytes() -> None:
+    grid = support.parse_grid_bytes(b'123\n456\n')
+    assert (grid.width, grid.height, grid.stride) == (3, 2, 4)
+    assert grid.at(0, 0) == ord('1')
+    assert grid.at(2, 1) == ord('6')
+    assert support.parse_grid_bytes(b'123\n456').height == 2
+
+
+def test_mmap_grid(tmp_path: pathlib.Path) -> None:
+    f = tmp_path.joinpath('input.txt')
+    f.write_bytes(b'#.\n.#\n')
+    with support.mmap_grid(str(f)) as grid:
+        assert (grid.width, grid.height) == (2, 2)
+        assert grid.at(1, 1) == ord('#')
+
+
+def test_grid2d_index_coords() -> None:
+    grid = support.Grid2D(4, 3, x_min=-1, y_min=5)
+    assert grid.bounds == (support.Bound(-1, 2), support.Bound(5, 7))
+    assert grid.index(-1, 5) == 0
+    assert grid.index(2, 7) == 11
+    assert grid.coords(6) == (1, 6)
+    assert (2, 7) in grid
+    assert (3, 7) not in grid
+
+
+def test_grid2d_offsets_match_adjacent() -> None:
+    grid = support.Grid2D(5, 5)
+    i = grid.index(2, 2)
+    assert [grid.coords(i + o) for o in grid.offsets_4] == list(
+        support.adjacent_4(2, 2),
+    )
+    assert [grid.coords(i + o) for o in grid.offsets_8] == list(
+        support.adjacent_8(2, 2),
+    )
+
+
+def test_grid2d_neighbors_4() -> None:
+    grid = support.Grid2D(3, 2)
+    assert grid.neighbors_4(0) == [1, 3]
+    assert grid.neighbors_4(4) == [1, 5, 3]
+
+
+def test_grid2d_from_bytes() -> None:
+    grid = support.Grid2D.from_bytes(support.parse_grid_bytes(b'ab\ncd\n'))
+    assert grid.cells == b'abcd'
+
+
+def test_grid2d_count_neighbors_8() -> None:
+    grid = support.Grid2D.from_coords({(0, 0), (1, 0), (2, 2)}, margin=1)
+    counts = grid.count_neighbors_8()
+    expected = [
+        sum(pt in {(0, 0), (1, 0), (2, 2)} for pt in support.adjacent_8(x, y))
+        for y in grid.bounds[1].range
+        for x in grid.bounds[0].range
+    ]
+    assert list(counts) == expected
+
+
+def test_adjacent_many() -> None:
+    points = [(1, 2), (5, 5)]
+    assert support.adjacent_4_many(points) == [
+        *support.adjacent_4(1, 2), *support.adjacent_4(5, 5),
+    ]
+    assert support.adjacent_8_many(points) == [
+        *support.adjacent_8(1, 2), *support.adjacent_8(5, 5),
+    ]
+
+
+def test_occupancy_8() -> None:
+    occupied = {(0, 0), (1, 0), (2, 2)}
+    # bit k is the k-th neighbour from adjacent_8
+    assert support.occupancy_8(occupied, [(1, 1), (5, 5), (0, 1)]) == [
+        0b10000011, 0, 0b00000110,
+    ]
+
+
+def test_grid2d_neighbor_masks_8() -> None:
+    occupied = {(0, 0), (1, 0), (2, 2), (3, 1)}
+    grid = support.Grid2D.from_coords(occupied, margin=1)
+    bx, by = grid.bounds
+    points = [(x, y) for y in by.range for x in bx.range]
+    masks = grid.neighbor_masks_8()
+    assert list(masks) == support.occupancy_8(occupied, points)
+
+
+def test_direction4_cached() -> None:
+    for direction in support.Direction4:
+        assert direction.cw.ccw is direction
+        assert direction.opposite.opposite is direction
+        assert direction.cw.cw is direction.opposite
+        assert direction.cw is direction.cw
+
+
+@support.parametrize(('x', 'y'), ((1, 2), (2, 3)))
+def test_parametrize(x: int, y: int) -> None:
+    assert y == x + 1
+
+
+class _FakeAoC(http.server.BaseHTTPRequestHandler):
+    inputs: dict[str, str] = {}
+    requests: list[str] = []
+
+    def do_GET(self) -> None:
+        self.requests.append(self.path)
+        body = self.inputs.get(self.path)
+        if body is None:
+            self.send_error(404)
+        else:
+            self.send_response(200)
+            self.end_headers()
+            self.wfile.write(body.encode())
+
+    def log_message(self, *args: object) -> None:
+        pass
+
+
+@pytest.fixture
+def fake_aoc(
+        monkeypatch: pytest.MonkeyPatch,
+) -> Generator[type[_FakeAoC], None, None]:
+    handler = type('Handler', (_FakeAoC,), {'inputs': {}, 'requests': []})
+    server = http.server.HTTPServer(('127.0.0.1', 0), handler)
+    thread = threading.Thread(
+        target=server.serve_forever,
+        kwargs={'poll_interval': .01},
+        daemon=True,
+    )
+    thread.start()
+
+    monkeypatch.setenv('AOC_URL', f'http://127.0.0.1:{server.server_port}')
+    monkeypatch.setattr(support, '_get_cookie_headers', dict)
+    try:
+        yield handler
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _no_sleep(seconds: float) -> None:
+    raise AssertionError('slept')
+
+
+def test_fetch_input_cache(
+        fake_aoc: type[_FakeAoC],
+        tmp_path: pathlib.Path,
+) -> None:
+    fake_aoc.inputs['/2022/day/1/input'] = '1\n2\n'
+    cache_dir = str(tmp_path)
+
+    s = support.fetch_input(2022, 1, cache_dir=cache_dir, sleep=_no_sleep)
+    assert s == '1\n2\n'
+    assert fake_aoc.requests == ['/2022/day/1/input']
+
+    s = support.fetch_input(2022, 1, cache_dir=cache_dir, sleep=_no_sleep)
+    assert s == '1\n2\n'
+    assert fake_aoc.requests == ['/2022/day/1/input']
+
+    sha = support.input_hash(s)
+    meta = json.loads(tmp_path.joinpath('index/2022-01.json').read_text())
+    assert meta['sha256'] == sha
+    assert tmp_path.joinpath('objects', sha[:2], sha).read_text() == s
+
+
+def test_fetch_input_corrupt_cache(
+        fake_aoc: type[_FakeAoC],
+        tmp_path: pathlib.Path,
+) -> None:
+    fake_aoc.inputs['/2022/day/2/input'] = 'A Y\n'
+    sha = support.cache_input(2022, 2, 'A Y\n', str(tmp_path))
+    tmp_path.joinpath('objects', sha[:2], sha).write_text('B Z\n')
+
+    assert support.cached_input(2022, 2, str(tmp_path)) is None
+    s = support.fetch_input(2022, 2, cache_dir=str(tmp_path))
+    assert s == 'A Y\n'
+    assert fake_aoc.requests == ['/2022/day/2/input']
+
+
+def test_fetch_input_offline(
+        fake_aoc: type[_FakeAoC],
+        tmp_path: pathlib.Path,
+) -> None:
+    support.cache_input(2022, 3, 'abc\n', str(tmp_path))
+
+    assert support.fetch_input(2022, 3, cache_dir=str(tmp_path), offline=True)
+    with pytest.raises(SystemExit):
+        support.fetch_input(2022, 4, cache_dir=str(tmp_path), offline=True)
+    assert fake_aoc.requests == []
+
+
+def test_fetch_input_retries(fake_aoc: type[_FakeAoC]) -> None:
+    sleeps: list[float] = []
+    with pytest.raises(SystemExit):
+        support.fetch_input(2022, 5, retries=3, sleep=sleeps.append)
+    assert len(fake_aoc.requests) == 3
+    assert sleeps == [1, 1]
+
+
+def _load_solver(path: pathlib.Path, src: str) -> Any:
+    path.parent.mkdir(exist_ok=True)
+    path.write_text(src)
+    spec = importlib.util.spec_from_file_location(f'm{hash(src)}', path)
+    assert spec is not None and spec.loader is not None
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+def test_cached_answer(tmp_path: pathlib.Path) -> None:
+    solver = tmp_path.joinpath('day99', 'part1.py')
+    db = str(tmp_path.joinpath('answers.db'))
+    src = (
+        'calls = []\n'
+        'def compute(s):\n'
+        '    calls.append(s)\n'
+        '    return len(s)\n'
+    )
+
+    mod = _load_solver(solver, src)
+    assert support.cached_answer(mod.compute, 'abc', path=db) == 3
+    assert support.cached_answer(mod.compute, 'abc', path=db) == 3
+    assert mod.calls == ['abc']
+
+    assert support.cached_answer(mod.compute, 'abcd', path=db) == 4
+    assert mod.calls == ['abc', 'abcd']
+
+    # editing the solver invalidates its answers
+    mod = _load_solver(solver, src.replace('len(s)', 'str(len(s))'))
+    assert support.cached_answer(mod.compute, 'abc', path=db) == '3'
+    assert support.cached_answer(mod.compute, 'abc', path=db) == '3'
+    assert mod.calls == ['abc']
+
+
+def test_cached_answer_evicts_least_recently_used(
+        tmp_path: pathlib.Path,
+) -> None:
+    solver = tmp_path.joinpath('day99', 'part2.py')
+    db = str(tmp_path.joinpath('answers.db'))
+    src = 'calls = []\ndef compute(s):\n    calls.append(s)\n    return s\n'
+    mod = _load_solver(solver, src)
+
+    for s in ('a', 'b', 'a', 'c'):
+        support.cached_answer(mod.compute, s, path=db, max_entries=2)
+    assert mod.calls == ['a', 'b', 'c']
+
+    support.cached_answer(mod.compute, 'a', path=db, max_entries=2)
+    support.cached_answer(mod.compute, 'b', path=db, max_entries=2)
+    assert mod.calls == ['a', 'b', 'c', 'b']
+
+
+@pytest.mark.parametrize(
+    ('contents', 'expected'),
+    (
+        ('You gave an answer too recently; you have to wait after '
+         'submitting an answer before trying again.  You have 37s left to '
+         'wait.', 37),
+        ('You have 1m 5s left to wait.', 65),
+        ("That's not the right answer.  Please wait one minute before "
+         'trying again.', 60),
+        ('Please wait 5 minutes before trying again.', 300),
+        ("That's the right answer!", None),
+    ),
+)
+def test_parse_wait(contents: str, expected: float | None) -> None:
+    assert support.parse_wait(contents) == expected
+
+
+class _FakeAnswers(http.server.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    pages: list[str] = []
+    posts: list[tuple[str, str]] = []
+    connections: list[object] = []
+
+    def setup(self) -> None:
+        super().setup()
+        self.connections.append(self)
+
+    def do_POST(self) -> None:
+        body = self.rfile.read(int(self.headers['Content-Length']))
+        self.posts.append((self.path, body.decode()))
+        contents = self.pages.pop(0).encode()
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(contents)))
+        self.end_headers()
+        self.wfile.write(contents)
+
+    def log_message(self, *args: object) -> None:
+        pass
+
+
+def _serve(handler: type[_FakeAnswers]) -> http.server.HTTPServer:
+    server = http.server.HTTPServer(('127.0.0.1', 0), handler)
+    thread = threading.Thread(
+        target=server.serve_forever,
+        kwargs={'poll_interval': .01},
+        daemon=True,
+    )
+    thread.start()
+    return server
+
+
+def test_submit_batch(monkeypatch: pytest.MonkeyPatch) -> None:
+    class Handler(_FakeAnswers):
+        pages = [
+            "That's the right answer!",
+            'You gave an answer too recently; you have to wait after '
+            'submitting an answer before trying again.  You have 37s left '
+            'to wait.',
+            "That's not the right answer.  Please wait one minute before "
+            'trying again.',
+            "That's the right answer!",
+        ]
+        posts = []
+        connections = []
+
+    server = _serve(Handler)
+    monkeypatch.setattr(support, '_get_cookie_headers', dict)
+
+    now = 0.
+    sleeps: list[float] = []
+
+    def clock() -> float:
+        return now
+
+    def sleep(seconds: float) -> None:
+        nonlocal now
+        sleeps.append(seconds)
+        now += seconds
+
+    client = support.AnswerClient(f'http://127.0.0.1:{server.server_port}')
+    submissions = [
+        support.Submission(1, 1, 24000),
+        support.Submission(1, 2, 45000),
+        support.Submission(2, 1, 15),
+    ]
+    try:
+        results = support.submit_batch(
+            2022, submissions, client.post, sleep=sleep, clock=clock,
+        )
+    finally:
+        client.close()
+        server.shutdown()
+        server.server_close()
+
+    assert sleeps == [37, 60]
+    assert [path for path, _ in Handler.posts] == [
+        '/2022/day/1/answer',
+        '/2022/day/1/answer',
+        '/2022/day/1/answer',
+        '/2022/day/2/answer',
+    ]
+    assert Handler.posts[1][1] == 'level=2&answer=45000'
+    assert [submission for submission, _ in results] == submissions
+    assert support.RIGHT in results[0][1]
+    assert support.WRONG.search(results[1][1])
+    assert support.RIGHT in results[2][1]
+    assert len(Handler.connections) == 1
+
+
+def test_submit_batch_keeps_duplicates() -> None:
+    submissions = [support.Submission(1, 1, 5)] * 2
+    pages = iter(("That's not the right answer.", "That's the right answer!"))
+
+    def post(year: int, day: int, part: int, answer: int) -> str:
+        return next(pages)
+
+    results = support.submit_batch(2022, submissions, post)
+    assert [contents for _, contents in results] == [
+        "That's not the right answer.", "That's the right answer!",
+    ]
+
+
+def test_answer_client_reconnects_dropped_connection(
+        monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    class Handler(_FakeAnswers):
+        pages = ["That's the right answer!"] * 2
+        posts = []
+        connections = []
+
+        def do_POST(self) -> None:
+            super().do_POST()
+            # drop the keep-alive connection without telling the client
+            self.close_connection = True
+
+    server = _serve(Handler)
+    monkeypatch.setattr(support, '_get_cookie_headers', dict)
+    client = support.AnswerClient(f'http://127.0.0.1:{server.server_port}')
+    try:
+        client.post(2022, 1, 1, 24000)
+        time.sleep(.05)
+        assert support.RIGHT in client.post(2022, 1, 2, 45000)
+    finally:
+        client.close()
+        server.shutdown()
+        server.server_close()
+
+    assert len(Handler.posts) == 2
+    assert len(Handler.connections) == 2
+
+
+def test_answer_client_does_not_resend(
+        monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    class Handler(_FakeAnswers):
+        posts = []
+        connections = []
+
+        def do_POST(self) -> None:
+            # receive the answer, then hang up before responding
+            body = self.rfile.read(int(self.headers['Content-Length']))
+            self.posts.append((self.path, body.decode()))
+            self.close_connection = True
+
+    server = _serve(Handler)
+    monkeypatch.setattr(support, '_get_cookie_headers', dict)
+    client = support.AnswerClient(f'http://127.0.0.1:{server.server_port}')
+    try:
+        with pytest.raises(ConnectionError):
+            client.post(2022, 1, 1, 24000)
+    finally:
+        client.close()
+        server.shutdown()
+        server.server_close()
+
+    assert len(Handler.posts) == 1
+
+
+def _slow_compute(s: str) -> int:
+    end = time.monotonic() + .05
+    while time.monotonic() < end:
+        pass
+    return len(s) + len([c for c in s])
+
+
+@pytest.mark.parametrize(
+    ('kind', 'suffix'),
+    (
+        ('cprofile', '.pstats'),
+        ('tracemalloc', '.tracemalloc.txt'),
+        ('sample', '.collapsed'),
+    ),
+)
+def test_profile_compute(
+        tmp_path: pathlib.Path,
+        kind: str,
+        suffix: str,
+) -> None:
+    prefix = str(tmp_path.joinpath('profiles', 'day99.part1'))
+    answer = support.profile_compute(
+        _slow_compute, 'abc', kind, prefix, interval=.001,
+    )
+    assert answer == 6
+    assert tmp_path.joinpath('profiles', f'day99.part1{suffix}').exists()
+
+
+def test_profile_compute_sample_stacks(tmp_path: pathlib.Path) -> None:
+    prefix = str(tmp_path.joinpath('day99.part1'))
+    support.profile_compute(_slow_compute, '', 'sample', prefix, interval=.001)
+
+    lines = tmp_path.joinpath('day99.part1.collapsed').read_text().splitlines()
+    assert lines
+    for line in lines:
+        stack, _, n = line.rpartition(' ')
+        assert stack.startswith('_slow_compute (support/support_test.py:')
+        assert int(n) > 0
+
+
+def test_count() -> None:
+    support.count('disabled')
+    assert support.counters == {}
+
+    support.enable_counters()
+    try:
+        support.count('pushes')
+        support.count('pushes', 2)
+        support.count('pops')
+        assert support.counters == {'pushes': 3, 'pops': 1}
+        assert support.format_counters(support.counters) == (
+            'pops: 1, pushes: 3'
+        )
+    finally:
+        support.enable_counters(False)
+        support.counters.clear()
+
+
+# 0 -> 1 -> 2 -> 3, with a shortcut 0 -> 2 and an unreachable 4
+_GRAPH = [[1, 2], [2], [3], [], [0]]
+_WEIGHTED = [[(1, 1), (2, 5)], [(2, 1)], [(3, 0)], [], [(0, 1)]]
+
+
+def test_bfs() -> None:
+    assert support.bfs((0,), _GRAPH.__getitem__) == {0: 0, 1: 1, 2: 1, 3: 2}
+    assert support.bfs_int(_GRAPH, (0,)) == [0, 1, 1, 2, -1]
+    assert support.bfs_int(_GRAPH, (1, 4)) == [1, 0, 1, 2, 0]
+
+
+@pytest.mark.parametrize(
+    'search',
+    (
+        lambda: support.bfs((0,), _GRAPH.__getitem__),
+        lambda: support.bfs_int(_GRAPH, (0,)),
+    ),
+)
+def test_bfs_counters(search: Callable[[], object]) -> None:
+    support.enable_counters()
+    try:
+        search()
+        # 1 -> 2 finds 2 already seen from 0
+        assert support.counters == {'bfs states': 4, 'bfs seen hits': 1}
+    finally:
+        support.enable_counters(False)
+        support.counters.clear()
+
+
+def test_bfs_01() -> None:
+    def edges(node: int) -> list[tuple[int, int]]:
+        return [(n, min(w, 1)) for n, w in _WEIGHTED[node]]
+
+    assert support.bfs_01(edges, (0,)) == {0: 0, 1: 1, 2: 1, 3: 1}
+
+
+def test_dijkstra() -> None:
+    dist = support.dijkstra(_WEIGHTED.__getitem__, (0,))
+    assert dist == {0: 0, 1: 1, 2: 2, 3: 2}
+    assert support.dijkstra(_WEIGHTED.__getitem__, (0,), goal=2)[2] == 2
+
+
+def test_astar() -> None:
+    def h(node: int) -> int:
+        return 0
+
+    assert support.astar(_WEIGHTED.__getitem__, 0, 3, h) == 2
+    assert support.astar(_WEIGHTED.__getitem__, 0, 4, h) is None
+
+
+def test_bfs_bidirectional() -> None:
+    reverse: list[list[int]] = [[] for _ in _GRAPH]
+    for node, targets in enumerate(_GRAPH):
+        for target in targets:
+            reverse[target].append(node)
+
+    def search(start: int, goal: int) -> int | None:
+        return support.bfs_bidirectional(
+            _GRAPH.__getitem__, start, goal,
+            reverse_neighbors=reverse.__getitem__,
+        )
+
+    assert search(0, 0) == 0
+    assert search(0, 3) == 2
+    assert search(4, 3) == 3
+    assert search(3, 0) is None
+
+
+def test_bfs_bidirectional_grid() -> None:
+    def neighbors(pt: tuple[int, int]) -> list[tuple[int, int]]:
+        return [
+            (x, y) for x, y in support.adjacent_4(*pt)
+            if 0 <= x < 10 and 0 <= y < 10
+        ]
+
+    assert support.bfs_bidirectional(neighbors, (0, 0), (9, 7)) == 16
+
+
+def test_parse_numbers_array() -> None:
+    ret = support.parse_numbers_array(b'1 -2\n3\n')
+    assert ret.typecode == 'q'
+    assert ret.tolist() == [1, -2, 3]
+    assert support.parse_numbers_comma_array(b'1,2,3\n').tolist() == [1, 2, 3]
+
+
+def test_parse_ints_array() -> None:
+    b = b'Sensor at x=-2, y=18: beacon at x=10, y=-16\n'
+    assert support.parse_ints_array(b).tolist() == [-2, 18, 10, -16]
+    unsigned = support.parse_ints_array(b, signed=False)
+    assert unsigned.tolist() == [2, 18, 10, 16]
+    assert support.parse_ints_array(b'').tolist() == []
+
+
+def test_parse_points_array() -> None:
+    ret = support.parse_points_array(b'498,4 -> 498,6\n', signed=False)
+    assert ret.tolist() == [498, 4, 498, 6]
+    with pytest.raises(ValueError):
+        support.parse_points_array(b'1,2,3\n4,5\n', 3)
+
+
+def test_parse_int_records() -> None:
+    b = (
+        b'Sensor at x=2, y=18: closest beacon is at x=-2, y=15\n'
+        b'Sensor at x=9, y=16: closest beacon is at x=10, y=16\n'
+    )
+    records = support.parse_int_records(b, 4)
+    assert records.rows == 2
+    assert records.row(1).tolist() == [9, 16, 10, 16]
+    assert records.column(2).tolist() == [-2, 10]
+    assert list(records.records()) == [(2, 18, -2, 15), (9, 16, 10, 16)]
+
+
+def test_parse_ints_array_dash_separators() -> None:
+    # `-` which isn't a sign falls back to the regex
+    assert support.parse_ints_array(b'1,2 -> 3,-4').tolist() == [1, 2, 3, -4]
+
+
+def test_parse_ints_array_ranges() -> None:
+    # a `-` before a digit is a sign, so ranges need `signed=False`
+    assert support.parse_ints_array(b'2-4,6-8').tolist() == [2, -4, 6, -8]
+    ret = support.parse_ints_array(b'2-4,6-8', signed=False)
+    assert ret.tolist() == [2, 4, 6, 8]